@@ -0,0 +1,142 @@
+# answer_cache.py
+# -------------------------------------------------------
+# Two-tier answer cache in front of the chatbot's QA chain:
+#   1. exact match on the normalized question
+#   2. nearest neighbour on the question embedding, above a
+#      cosine-similarity threshold
+# Entries expire after a TTL, are evicted LRU past a size
+# limit, and are dropped when the knowledge base changes.
+# -------------------------------------------------------
+
+import re
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_THRESHOLD = 0.92
+
+_PUNCT = re.compile(r"[^\w\s]")
+_SPACE = re.compile(r"\s+")
+
+
+def normalize(query):
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return _SPACE.sub(" ", _PUNCT.sub(" ", query.lower())).strip()
+
+
+class AnswerCache:
+    """Exact + semantic cache of chatbot answers.
+
+    ``embed`` maps a string to a vector (e.g. ``HuggingFaceEmbeddings.embed_query``);
+    it is only called when the exact tier misses.
+    """
+
+    def __init__(self, embed, threshold=DEFAULT_THRESHOLD, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL_SECONDS):
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version = None
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()   # normalized query -> (answer, unit vector, created_at)
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    # ---------- lookups ----------
+    def get_or_compute(self, query, compute, version=None):
+        """Cached answer for ``query``, else ``compute(query)`` (cached on success)."""
+        key = normalize(query)
+        with self._lock:
+            self._check_version(version)
+            answer = self._exact(key)
+            if answer is not None:
+                self.exact_hits += 1
+                return answer
+
+        vec = self._unit(self.embed(key))
+        with self._lock:
+            answer = self._nearest(vec)
+            if answer is not None:
+                self.semantic_hits += 1
+                return answer
+            self.misses += 1
+
+        answer = compute(query)
+        with self._lock:
+            if version is None or version == self.version:
+                self._entries[key] = (answer, vec, time.monotonic())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return answer
+
+    def _exact(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if self._expired(entry):
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def _nearest(self, vec):
+        for key in [k for k, e in self._entries.items() if self._expired(e)]:
+            del self._entries[key]
+            self.expirations += 1
+        if not self._entries:
+            return None
+        keys = list(self._entries)
+        sims = np.stack([self._entries[k][1] for k in keys]) @ vec
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+        self._entries.move_to_end(keys[best])
+        return self._entries[keys[best]][0]
+
+    # ---------- bookkeeping ----------
+    def _expired(self, entry):
+        return time.monotonic() - entry[2] > self.ttl
+
+    @staticmethod
+    def _unit(vec):
+        vec = np.asarray(vec, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def _check_version(self, version):
+        # A rebuilt knowledge base makes every cached answer suspect.
+        if version is not None and version != self.version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self.version = version
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            hits = self.exact_hits + self.semantic_hits
+            total = hits + self.misses
+            return {
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "hit_rate": hits / total if total else 0.0,
+                "entries": len(self._entries),
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -6,17 +6,23 @@
 # -------------------------------------------------------
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-import time
-import io
-import base64
+# First app module imported, so its clock also covers the imports below (cold-start check)
+import section_timing
 from datetime import datetime
+import json
 import os
 
-import streamlit as st
-import base64
+# Imported for every visitor, so keep this cheap: chatbot defers langchain /
+# transformers / faiss until the assistant loads (see benchmarks/startup.py)
+import chatbot
+import ingest
+
+import cards
+from assets import ASSET_MODE, COVER_WIDTH, LOGO_SIZE, QUERY_ASSET_MODES, asset_cache, asset_url, icon_bundle, image_key, preload_html
+from content import content_store
+from fragments import fragment_cache
+from project_index import ProjectIndex
+from theme import site_stylesheet
 
 # =========================
 # Page Config
@@ -28,128 +34,76 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
+# Image delivery (inline data URIs vs static files); ?assets=inline|static overrides for benchmarking
+asset_mode = st.query_params.get("assets", ASSET_MODE)
+if asset_mode not in QUERY_ASSET_MODES:
+    asset_mode = ASSET_MODE
+# Card HTML is cached per process (see fragments.py); anything that changes the markup goes in the key
+theme = st.context.theme.type
+fragment_cache.start_rerun()
+# Per-section wall time for this session (?debug=1 shows it); ?profile=1 also
+# records bytes sent and file I/O per section and shows the overlay, where
+# allowed (PORTFOLIO_PROFILE_ALLOW=1 or development mode; see section_timing.py)
+profiling = section_timing.start_page(profile=bool(st.query_params.get("profile")))
+debug = bool(st.query_params.get("debug"))
+
 # =========================
-# Custom CSS
+# Assistant warm-up
 # =========================
-CUSTOM_CSS = """
-<style>
-:root{
-  --bg: #0b1020;
-  --card: rgba(255,255,255,0.06);
-  --card-border: rgba(255,255,255,0.12);
-  --text: #E5E7EB;
-  --muted: #9CA3AF;
-  --brand: #34D399;
-  --brand-2: #60A5FA;
-  --shadow: 0 20px 60px rgba(0,0,0,0.35);
-}
-
-.stApp {
-  background: radial-gradient(1200px 600px at 10% -10%, rgba(52,211,153,0.2), transparent 40%),
-              radial-gradient(1200px 600px at 110% 10%, rgba(96,165,250,0.14), transparent 40%),
-              linear-gradient(180deg, #0b1020 0%, #0a0f1b 100%);
-  color: var(--text);
-  font-family: Inter, ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, "Helvetica Neue", Arial;
-}
-
-.block-container {padding-top: 2rem;}
-h1, h2, h3 { letter-spacing: -0.02em; }
-.big-title { font-weight: 900; font-size: clamp(2rem, 6vw, 3.5rem); line-height: 1.05; }
-.subhead { color: var(--muted); font-size: clamp(1rem, 2.2vw, 1.25rem); }
-
-/* Cards */
-.card {
-  background: var(--card);
-  border: 1px solid var(--card-border);
-  border-radius: 20px;
-  box-shadow: var(--shadow);
-  backdrop-filter: blur(12px);
-  padding: 1.2rem 1.3rem;
-}
-.card-hover:hover { transform: translateY(-4px); background: rgba(255,255,255,0.08); }
-
-/* Buttons */
-.btn {
-  display: inline-flex; align-items: center; gap: .6rem;
-  padding: .7rem 1rem; border-radius: 14px;
-  font-weight: 600; text-decoration: none !important;
-  border: 1px solid var(--card-border); box-shadow: var(--shadow);
-}
-.btn-primary { background: linear-gradient(90deg, var(--brand), var(--brand-2)); color: #0a0f1b; border: none; }
-.btn-ghost { background: var(--card); color: var(--text); }
-.btn-ghost:hover { background: rgba(255,255,255,0.09); }
-
-.hr { height: 1px; background: linear-gradient(90deg, transparent, rgba(255,255,255,0.15), transparent); margin: 1.5rem 0; border: 0; }
-
-.tags { display:flex; gap:.5rem; flex-wrap:wrap; }
-.tag {
-  font-size:.8rem; padding:.35rem .6rem; border-radius:999px;
-  background: rgba(255,255,255,0.08); border:1px solid rgba(255,255,255,0.18);
-}
-
-[data-testid="stDecoration"], footer, header { display: none !important; }
-</style>
-"""
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+# Once per process, right after page config (and again when projects.json
+# changes): project descriptions join the assistant's knowledge base and its
+# models start loading in the background. Streamlit runs nothing before the
+# first session's script run, so that run is the earliest hook.
+@st.cache_resource(max_entries=2)
+def start_assistant(projects_version):
+    # Documents are built (importing langchain) on the warm-up thread, not here
+    projects = content_store.get("projects")
+    chatbot.register_source("projects", lambda: ingest.project_documents(projects))
+    chatbot.start_warmup()
+
+if chatbot.available():
+    start_assistant(content_store.version("projects"))
 
 # =========================
-# Typing Effect (JS)
+# Custom CSS
 # =========================
-TYPING_HTML = """
-<div id="typing" class="subhead"></div>
-<script>
-const roles = ["Data Scientist", "ML Engineer", "Computer Vision", "NLP & RAG", "Analytics & Dashboards"];
-const el = window.parent.document.querySelector('#typing') || document.querySelector('#typing');
-let i = 0, j = 0, deleting = false, delay = 70, pause = 900;
-
-function loop(){
-  const word = roles[i % roles.length];
-  if(!deleting){
-    el.innerHTML = word.substring(0,j+1) + '<span class="cursor">▮</span>';
-    j++;
-    if(j === word.length){ deleting = true; setTimeout(loop, pause); return; }
-  } else {
-    el.innerHTML = word.substring(0,j-1) + '<span class="cursor">▮</span>';
-    j--;
-    if(j === 0){ deleting = false; i++; }
-  }
-  setTimeout(loop, deleting ? delay/2 : delay);
-}
-setTimeout(loop, 400);
-</script>
-"""
+section_timing.page_section("CSS")
+# Every page style (styles/*.css + the skill icon bundle) compiled into one cacheable
+# stylesheet; reruns re-send only its <link> (see theme.py)
+st.markdown(site_stylesheet.html(asset_mode), unsafe_allow_html=True)
 
 # =========================
-# Helper: Image Loader
+# Assistant-only view
 # =========================
-def get_base64_image(image_file):
-    try:
-        with open(image_file, "rb") as f:
-            return base64.b64encode(f.read()).decode()
-    except FileNotFoundError:
-        return ""
+# The static export (export_static.py) embeds ?view=assistant: only the chatbot
+# needs a live session, everything else is served as pre-rendered HTML
+if st.query_params.get("view") == "assistant":
+    section_timing.page_section("Assistant")
+    if chatbot.available():
+        chatbot.chatbot()
+    else:
+        st.info("The assistant is not available on this server.")
+    section_timing.end_page()
+    st.stop()
 
 # =========================
 # Hero Section
 # =========================
-import streamlit as st
+section_timing.page_section("Hero")
 import streamlit.components.v1 as components
 
 # Hero Section
 col1, col2 = st.columns([1.2, 1], gap="large")
 with col1:
-    st.markdown('<span class="badge">👨‍🔬 Data Science • AI Enthusiast</span>', unsafe_allow_html=True)
-    st.markdown(
-        '<div class="big-title">Hi 👋, I\'m <span style="background:linear-gradient(90deg,var(--brand),var(--brand-2)); -webkit-background-clip:text; color:transparent;">Ansh Kedia</span></div>',
-        unsafe_allow_html=True
-    )
+    st.markdown(cards.BADGE_HTML, unsafe_allow_html=True)
+    st.markdown(cards.TITLE_HTML, unsafe_allow_html=True)
 
     # ✅ FIXED TYPING EFFECT — runs JS safely
     components.html(
         """
         <div id="typing" style="color:#9CA3AF; font-size:1.25rem; margin-top:.3rem;"></div>
         <script>
-        const roles = ["Data Scientist", "ML Engineer", "Computer Vision", "NLP & RAG", "Agentic Ai", "Analytics & Dashboards"];
+        const roles = __ROLES__;
         const el = document.getElementById('typing');
         let i = 0, j = 0, deleting = false, delay = 80, pause = 800;
 
@@ -168,67 +122,23 @@ with col1:
         }
         setTimeout(loop, 500);
         </script>
-        """,
+        """.replace("__ROLES__", json.dumps(cards.TYPING_ROLES)),
         height=60,
     )
 
-    st.markdown(
-        """
-        <div class="subhead" style="margin-top: 1rem;">
-        I build intelligent, data-driven systems combining <b>Machine Learning</b>, <b>Computer Vision</b>, and <b>Natural Language Processing</b>.
-        My goal is to turn raw data into <b>insights, automation, and real-world impact</b>.
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(cards.INTRO_HTML, unsafe_allow_html=True)
 
 
 # =========================
 # About Section
 # =========================
+section_timing.page_section("About")
 ab_col1, ab_col2 = st.columns([1.4, 1])
 with ab_col1:
-    st.markdown(
-        """
-        <div class="card card-hover">
-          <h3>Quick Peek</h3>
-          <p style="color:var(--muted)">
-          Final-year Data Science student passionate about building intelligent systems that bridge the gap between data and decision-making.
-          Experienced in designing and deploying AI solutions with a focus on performance and interpretability.
-          </p>
-          <div class="tags">
-            <span class="tag">Python</span>
-            <span class="tag">TensorFlow</span>
-            <span class="tag">scikit-learn</span>
-            <span class="tag">OpenCV</span>
-            <span class="tag">Transformers</span>
-            <span class="tag">SQL</span>
-            <span class="tag">Plotly</span>
-            <span class="tag">Streamlit</span>
-          </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(cards.QUICK_PEEK_HTML, unsafe_allow_html=True)
 
 with ab_col2:
-    st.markdown(
-        """
-        <div class="card card-hover">
-          <h3>Connect Instantly</h3>
-          <div style="line-height:1.9;">
-            <strong>Email:</strong> anshkedia.04@gmail.com<br>
-            <strong>LinkedIn:</strong> <a href="https://www.linkedin.com/in/ansh-kedia-249843266/" target="_blank">linkedin.com/in/anshkedia</a><br>
-            <strong>GitHub:</strong> <a href="https://github.com/anshkedia-04" target="_blank">github.com/anshkedia</a><br>
-          </div>
-          <div style="margin-top: .8rem;">
-            <a class="btn btn-ghost" href="mailto:anshkedia.04@gmail.com">Email Me</a>
-            <a class="btn btn-primary" href="https://github.com/anshkedia-04" target="_blank">GitHub</a>
-          </div>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(cards.CONNECT_HTML, unsafe_allow_html=True)
 
 st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 
@@ -236,182 +146,86 @@ st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 # =========================
 # Skills Section
 # =========================
+section_timing.page_section("Skills")
 st.markdown("## Skills & Expertise")
 st.caption("A glance at my technical stack.")
 
-# Define skill categories
-skill_categories = {
-    "Programming": [
-        (" Python", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/python/python-original.svg"),
-        (" Java", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/java/java-original.svg"),
-        (" SQL", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/mysql/mysql-original.svg"),
-        (" Git", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/git/git-original.svg"),
-    ],
-    "Data Science": [
-        ("Pandas", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/pandas/pandas-original.svg"),
-        ("NumPy", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/numpy/numpy-original.svg"),
-        ("Scikit-learn", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/scikitlearn/scikitlearn-original.svg"),
-    ],
-    "Deep Learning": [
-        ("TensorFlow", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/tensorflow/tensorflow-original.svg"),
-        ("PyTorch", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/pytorch/pytorch-original.svg"),
-        ("CNN", "https://imgs.search.brave.com/fzKrZ13dBAhof8JjX-t39wbArWfq_8znKIhuG7Gp6go/rs:fit:860:0:0:0/g:ce/aHR0cHM6Ly9jZG4u/aWNvbnNjb3V0LmNv/bS9pY29uL3ByZW1p/dW0vcG5nLTI1Ni10/aHVtYi9uZXVyYWwt/bmV0d29yay1sb2dv/LWljb24tc3ZnLXBu/Zy1kb3dubG9hZC0x/NTM1MTMwLnBuZz9m/PXdlYnAmdz0xMjg"),
-    ],
-    "Computer Vision": [
-        ("OpenCV", "https://cdn.jsdelivr.net/gh/devicons/devicon/icons/opencv/opencv-original.svg"),
-    ],
-    "Natural Language Processing": [
-        ("LangChain", "https://imgs.search.brave.com/IgPYZP9QFG0iiIPnFZzQuNSHM7zTYelvbt3DfhT2eYA/rs:fit:860:0:0:0/g:ce/aHR0cHM6Ly9yZWdp/c3RyeS5ucG1taXJy/b3IuY29tL0Bsb2Jl/aHViL2ljb25zLXN0/YXRpYy1wbmcvbGF0/ZXN0L2ZpbGVzL2Rh/cmsvbGFuZ3NtaXRo/LnBuZw"),
-        ("LangGraph", "https://imgs.search.brave.com/IgPYZP9QFG0iiIPnFZzQuNSHM7zTYelvbt3DfhT2eYA/rs:fit:860:0:0:0/g:ce/aHR0cHM6Ly9yZWdp/c3RyeS5ucG1taXJy/b3IuY29tL0Bsb2Jl/aHViL2ljb25zLXN0/YXRpYy1wbmcvbGF0/ZXN0L2ZpbGVzL2Rh/cmsvbGFuZ3NtaXRo/LnBuZw"),
-        ("Hugging Face", "https://huggingface.co/front/assets/huggingface_logo-noborder.svg"),
-    ],
-    "Visualization": [
-        ("Streamlit", "https://streamlit.io/images/brand/streamlit-mark-color.png"),
-        ("Plotly", "https://images.plot.ly/logo/plotly-logo-color.png"),
-        ("Tableau", "https://cdn.worldvectorlogo.com/logos/tableau-software.svg"),
-        ("PowerBI", "https://imgs.search.brave.com/p94jLqUg8ptH4YJkAAkACVma2gKzLJBw_JK-1h3oZzc/rs:fit:860:0:0:0/g:ce/aHR0cHM6Ly8xMDAw/bG9nb3MubmV0L3dw/LWNvbnRlbnQvdXBs/b2Fkcy8yMDIyLzA4/L01pY3Jvc29mdC1Q/b3dlci1CSS1Mb2dv/LTUwMHgyODEucG5n"),
-    ]
-}
-
 # Layout: 2 columns
 col1, col2 = st.columns(2)
 
-for i, (category, skills) in enumerate(skill_categories.items()):
+# Skill categories live in content/skills.json (see content.py)
+for i, group in enumerate(content_store.get("skills")):
     with (col1 if i % 2 == 0 else col2):
-        st.markdown(f"### {category}")
-        for name, icon_url in skills:
-            # Use an external icon if available, otherwise use a placeholder with the first letter
-            icon_html = f'<img src="{icon_url}" alt="{name}" width="28" style="margin-right:10px;">' if "http" in icon_url else f'<div style="width:28px;height:28px;border-radius:50%;background:var(--brand);color:var(--bg);display:flex;align-items:center;justify-content:center;font-weight:bold;font-size:.8rem;margin-right:10px;">{name[1][0]}</div>'
-            st.markdown(
-                f"""
-                <div style="display:flex; align-items:center; margin-bottom:10px;" class="card card-hover">
-                    {icon_html}
-                    <span style="font-size:16px;">{name}</span>
-                </div>
-                """,
-                unsafe_allow_html=True
-            )
+        st.markdown(f"### {group['category']}")
+        for skill in group["skills"]:
+            st.markdown(fragment_cache.get("skill", skill, cards.skill_card_html, theme, icon_bundle.version), unsafe_allow_html=True)
 
 st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 
 # =========================
 # Projects Section
 # =========================
+section_timing.page_section("Projects")
 st.markdown('<a id="projects"></a>', unsafe_allow_html=True)
 st.markdown("## Projects 🧑🏻‍💻")
 st.caption("Filter by tag and explore interactive demos.")
 
+# Projects live in content/projects.json (see content.py)
+PROJECTS = content_store.get("projects")
 
-PROJECTS = [
-    {
-        "title": "LifePulse (Currently working on it!)",
-        "desc": "“An AI synthesis engine that reasons across environment signals to tell you what to do next.",
-        "tags": ["FastAPI", "React", "PostgreSQL", "Reasoning Model"],
-        "img": "https://github.com/anshkedia-04/Portfolio_Streamlit/blob/main/Project_images/LifePulse.png?raw=true",
-        "repo": None,
-        "demo": None
-    },
-    {
-        "title": "VoyageAI: Travel Planner",
-        "desc": "An AI-powered travel planner that generates personalized itineraries based on user preferences.",
-        "tags": ["FastAPI", "Langchain", "Groq", "Streamlit"],
-        "img": "https://github.com/anshkedia-04/Portfolio_Streamlit/blob/main/Project_images/Voyage_AI.jpg?raw=true",
-        "repo": "https://github.com/anshkedia-04/VoyageAI-Smart-Travel-Assistant",
-        "demo": "https://voyageai-smart-travel-assistant-pkrk9xcpwhhynq4h3eylis.streamlit.app/"
-    },
-    {
-        "title": "MedAssist-XR",
-        "desc": "MedAssist XR is an AI-driven virtual healthcare assistant that helps users analyze symptoms, interpret lab reports, find nearby doctors or hospitals, and get health insights — all through a chat-based interface.",
-        "tags": ["FastAPI", "Langchain", "Groq", "Streamlit"],
-        "img": "https://github.com/anshkedia-04/Portfolio_Streamlit/blob/main/Project_images/MedAssist.jpg?raw=true",
-        "repo": "https://github.com/anshkedia-04/VoyageAI-Smart-Travel-Assistant",
-        "demo": None
-    },
-    {
-        "title": "🧑🏻‍💻 Facemask 360",
-        "desc": "A comprehensive solution for marking attendance using facial recognition.",
-        "tags": ["Classification", "Facenet", "OpenCV", "Streamlit"],
-        "img": "https://github.com/anshkedia-04/Portfolio_Streamlit/blob/main/Project_images/FaceMask.jpg?raw=true",
-        "repo": "https://github.com/anshkedia-04/Smart_Attend",
-        "demo": None
-    },
-    {
-        "title": "🏡 BrickWise: Bengaluru Price Prediction",
-        "desc": "Regression pipeline with cross-validation, feature selection, and hyperparameter tuning.",
-        "tags": ["ML", "Regression", "EDA","Streamlit"],
-        "img": "https://github.com/anshkedia-04/Portfolio_Streamlit/blob/main/Project_images/Brickwise.jpg?raw=true",
-        "repo": "https://github.com/anshkedia-04/House-Price-Prediction-",
-        "demo": "https://bengaluru-housepriceprediction.streamlit.app/"
-    },
-    {
-        "title": "🤖 BrewBot",
-        "desc": "Cafe FAQ Chatbot is an intelligent, open-source chatbot designed specifically for small cafés.",
-        "tags": ["Langchain","HuggingFace","Streamlit"],
-        "img": "https://github.com/anshkedia-04/Portfolio_Streamlit/blob/main/Project_images/BrewBot.jpg?raw=true",
-        "repo": "https://github.com/anshkedia-04/BrewBot",
-        "demo": None
-    },
-    {
-        "title": "🖱️ VisionMouse: Mouse Controller",
-        "desc": "A deep learning project that uses computer vision to control the mouse cursor with hand movements.",
-        "tags": ["MediaPipe", "OpenCV", "Streamlit"],
-        "img": "https://github.com/anshkedia-04/Portfolio_Streamlit/blob/main/Project_images/VisionMouse.jpg?raw=true",
-        "repo": "https://github.com/anshkedia-04/Gesture_Mouse_Control",
-        "demo": None
-    },
-    {
-        "title": "🔊 AirTune: Volume Controller",
-        "desc": "A deep learning project that uses computer vision to control the system volume with simple hand gestures.",
-        "tags": ["MediaPipe", "OpenCV", "Streamlit"],
-        "img": "https://github.com/anshkedia-04/Portfolio_Streamlit/blob/main/Project_images/AirTune.jpg?raw=true",
-        "repo": "https://github.com/anshkedia-04/AirTune",
-        "demo": None
-    }
-]
-
-# Tag filter
-all_tags = ["All"] + sorted({t for p in PROJECTS for t in p["tags"]})
-ft_col1, ft_col2 = st.columns([.7, .3])
-with ft_col1:
-    active_tag = st.segmented_control("Filter by Tag", options=all_tags, default="All", key="tag_filter")
-with ft_col2:
-    search = st.text_input("Search", placeholder="Search by title or description")
-
-# Filtered project rows
-rows = []
-for p in PROJECTS:
-    if active_tag != "All" and active_tag not in p["tags"]:
-        continue
-    if search and (search.lower() not in p["title"].lower() and search.lower() not in p["desc"].lower()):
-        continue
-    rows.append(p)
-
-# Display grid
-if not rows:
-    st.info("No projects match your filter. Try clearing search/tags.")
-else:
-    for i in range(0, len(rows), 3):
-        cols = st.columns(3, gap="large")
-        batch = rows[i:i+3]
-        for c, p in zip(cols, batch):
-            with c:
-                st.markdown(
-                    f"""
-                    <div class="card card-hover" style="padding:1rem; border-radius:1rem; box-shadow:0 4px 15px rgba(0,0,0,0.15); background-color:var(--background-color);">
-                      <img src="{p['img']}" class="project-cover" style="width:100%; border-radius:0.8rem; margin-bottom:0.7rem;"/>
-                      <h3 style="margin:.6rem 0 0 0;">{p['title']}</h3>
-                      <p style="color:var(--muted); margin:.25rem 0 .6rem 0;">{p['desc']}</p>
-                      <div class="tags" style="margin-bottom:.7rem;">
-                        {''.join([f'<span class="tag" style="display:inline-block; background:linear-gradient(135deg, #007bff, #00b4d8); color:white; padding:0.25rem 0.7rem; border-radius:0.6rem; margin:0.15rem; font-size:0.85rem; font-weight:500;">{t}</span>' for t in p['tags']])}
-                      </div>
-                      <div style="display:flex; justify-content:space-between; align-items:center; margin-top:0.8rem;">
-                        <a href="{p['repo']}" target="_blank" class="btn btn-primary" style="text-decoration:none; background:#007bff; color:white; padding:0.4rem 0.9rem; border-radius:0.5rem; font-weight:500;">Repo</a>
-                        {"<a href='"+p['demo']+"' target='_blank' class='btn btn-ghost' style='text-decoration:none; background:#f5f5f5; color:#007bff; padding:0.4rem 0.9rem; border-radius:0.5rem; font-weight:500;'>Demo</a>" if p['demo'] else ""}
-                      </div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True
-                )
+# Covers are self-hosted (see assets.image_sources); hint the first row early
+FIRST_ROW = 3
+st.markdown(
+    "".join(
+        fragment_cache.get("preload", p, lambda p: preload_html(p["img"], COVER_WIDTH, asset_mode), asset_mode, image_key(p["img"], COVER_WIDTH, asset_mode))
+        for p in PROJECTS[:FIRST_ROW]
+    ),
+    unsafe_allow_html=True,
+)
+
+# Tag / search index, built once per process (and again when projects.json changes)
+@st.cache_resource(max_entries=2)
+def get_project_index(version, _projects):
+    return ProjectIndex(_projects)
+
+project_index = get_project_index(content_store.version("projects"), PROJECTS)
+
+# Filters + grid rerun on their own: a keystroke or tag toggle skips the rest of the page
+@st.fragment
+def projects_grid():
+    with section_timing.timed("Projects grid"):
+        # Tag filter
+        ft_col1, ft_col2, ft_col3 = st.columns([.6, .1, .3])
+        with ft_col1:
+            active_tags = st.segmented_control("Filter by Tag", options=project_index.tags, selection_mode="multi", key="tag_filter")
+        with ft_col2:
+            tag_mode = st.segmented_control("Match", options=["any", "all"], default="any", key="tag_mode")
+        with ft_col3:
+            search = st.text_input("Search", placeholder="Search by title or description")
+
+        # Filtered project rows
+        rows = project_index.filter(active_tags, search, tag_mode or "any")
+
+        # Display grid
+        if not rows:
+            st.info("No projects match your filter. Try clearing search/tags.")
+        else:
+            for i in range(0, len(rows), 3):
+                cols = st.columns(3, gap="large")
+                batch = rows[i:i+3]
+                # First row loads eagerly at high priority; the rest lazily
+                img_attrs = 'loading="eager" fetchpriority="high"' if i < FIRST_ROW else 'loading="lazy"'
+                for c, p in zip(cols, batch):
+                    with c:
+                        html = fragment_cache.get(
+                            "project", p, lambda p: cards.project_card_html(p, img_attrs, asset_mode),
+                            asset_mode, theme, img_attrs, image_key(p["img"], COVER_WIDTH, asset_mode),
+                        )
+                        st.markdown(html, unsafe_allow_html=True)
+    if debug:
+        section_timing.caption("Projects grid")
+
+projects_grid()
 
 st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 
@@ -419,39 +233,13 @@ st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 # =========================
 # Resume (Timeline - Separated into Tabs) - REVISED
 # =========================
+section_timing.page_section("Resume")
 
 def render_timeline_item(it):
-    """Renders a single timeline item using st.markdown with unsafe_allow_html."""
-    
-    # 1. Base64 conversion
-    logo_html = ""
-    try:
-        # Check if the logo file exists
-        if os.path.exists(it["logo"]):
-            with open(it["logo"], "rb") as f:
-                logo_b64 = base64.b64encode(f.read()).decode()
-                logo_html = f'<img src="data:image/png;base64,{logo_b64}" style="width:40px;height:40px;object-fit:contain;border-radius:8px;border:1px solid rgba(255,255,255,0.2);" />'
-        else:
-            # Placeholder for missing logo
-            logo_html = '<div style="width:40px;height:40px;border-radius:8px;background:rgba(255,255,255,0.1);display:flex;align-items:center;justify-content:center;font-size:.8rem;color:gray;">N/A</div>'
-    except Exception:
-         logo_html = '<div style="width:40px;height:40px;border-radius:8px;background:rgba(255,255,255,0.1);display:flex;align-items:center;justify-content:center;font-size:.8rem;color:gray;">N/A</div>'
-
-    # 2. Render the item HTML
-    st.markdown(
-        f"""
-        <div class="timeline-item card-hover" style="display:flex; gap:1rem; align-items:center; padding:.9rem 1rem; border-radius:16px;">
-          {logo_html}
-          <div>
-            <div style="color:#86efac; font-weight:700; font-size:.85rem;">{it['when']}</div>
-            <div style="font-weight:700; margin-top:.15rem;">{it['title']}</div>
-            <div style="color:var(--muted); font-size:.9rem;">{it['where']}</div>
-            <div style="color:var(--muted); margin-top:.25rem; font-size:.9rem;">{it['detail']}</div>
-          </div>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    """Renders a single timeline item (HTML cached per process) with unsafe_allow_html."""
+    # The logo's resolved files are part of the key, so a replaced logo shows without a restart
+    key = image_key(it["logo"], LOGO_SIZE, asset_mode)
+    st.markdown(fragment_cache.get("timeline", it, lambda it: cards.timeline_item_html(it, asset_mode), asset_mode, theme, key), unsafe_allow_html=True)
 
 def render_timeline(items):
     """Renders the entire timeline structure."""
@@ -461,99 +249,6 @@ def render_timeline(items):
     st.markdown('</div>', unsafe_allow_html=True)
 
 
-# Data remains the same... (Education, Internships, Certifications)
-education_items = [
-    {
-        "when": "2022 — Present",
-        "title": "B.Tech (Final Year) — Computer Science and Engineering",
-        "where": "Parul University",
-        "detail": "Coursework in: ML, DL, CV, NLP, DSA, DBMS.",
-        "logo": "logos/parul.png"
-    },
-    {
-        "when": "2020 — 2022",
-        "title": "Senior Secondary Education — Science Stream",
-        "where": "Green Valley High School",
-        "detail": "Coursework in: Physics, Chemistry, Mathematics.",
-        "logo": "logos/greenValley.webp"
-    },
-    {
-        "when": "Till 2020",
-        "title": "Secondary Education",
-        "where": "Tree House High School",
-        "detail": "Completed high school with a focus on Science and Mathematics.",
-        "logo": "logos/tree_house.webp"
-    },
-]
-
-internship_items = [
-    # {
-    #     "when": "Nov'25 - July'25",
-    #     "title": "AI Intern",
-    #     "where": "MyOnSite Healthcare Pvt. Ltd.",
-    #     "detail": "Not started yet.",
-    #     "logo": "logos/myonsite.jpg"
-    # },
-    {
-        "when": "Summer 2025",
-        "title": "Data Science Summer Intern",
-        "where": "Celebal Technologies Pvt. Ltd.",
-        "detail": "Shipped ML features with A/B tested improvements.",
-        "logo": "logos/celebal.png"
-    },
-    {
-        "when": "Jan 2025 - Apr 2025",
-        "title": "Machine Learning Intern",
-        "where": "Unified Mentor Pvt. Ltd.",
-        "detail": "Gained hands-on experience with Python, Scikit-learn and Tensorflow",
-        "logo": "logos/unified.png"
-    },
-    {
-        "when": "Summer 2024",
-        "title": "Data Science Intern",
-        "where": "SkillForge E-Learning Solutions Pvt. Ltd.",
-        "detail": "Hands-on experience in python, analytics and machine learning",
-        "logo": "logos/skillforge.png"
-    },
-]
-
-certification_items = [
-    {
-        "when": "2025",
-        "title": "Career Essentials in Generative AI",
-        "where": "Microsfoft and LinkedIn",
-        "detail": "Microsoft Copilot, Responsible AI, Generative AI, AI for Business, Prompt Engineering",
-        "logo": "logos/microsoft.png"
-    },
-    {
-        "when": "2025",
-        "title": "Introduction to Generative AI",
-        "where": "Google Cloud",
-        "detail": "Fundamentals of Generative AI, Large Language Models, and their applications.",
-        "logo": "logos/google.png"
-    },
-    {
-        "when": "2024",
-        "title": "Microsoft Certification",
-        "where": "Ignite Edition Challenge",
-        "detail": "Explored cloud computing concepts, AI integration, and Microsoft tools.",
-        "logo": "logos/microsoft.png"
-    },
-    {
-        "when": "2024",
-        "title": "Cisco Certification",
-        "where": "Python Essentials",
-        "detail": "Built a strong foundation in Python programming, data structures, and scripting.",
-        "logo": "logos/cisco.png"
-    },
-    {
-        "when": "2024",
-        "title": "Cisco Certification",
-        "where": "Introduction to Data Science",
-        "detail": "Gained foundational knowledge in data science concepts, tools, and techniques.",
-        "logo": "logos/cisco.png"
-    },
-]
 # --- REVISED STREAMLIT DISPLAY LOGIC ---
 st.markdown("## Highlights 📜")
 st.caption("Education, internships, and certifications organized by timeline.")
@@ -562,90 +257,52 @@ cL, cR = st.columns([1.3, 1])
 with cL:
     tab1, tab2, tab3 = st.tabs(["Education", "Internships", "Certifications"])
     
+    # Entries come from content/{education,internships,certifications}.json
     with tab1:
         # 🔑 FIX: Direct Python rendering of each item inside the timeline container
-        render_timeline(education_items) 
+        render_timeline(content_store.get("education")) 
 
     with tab2:
         # 🔑 FIX: Direct Python rendering of each item inside the timeline container
-        render_timeline(internship_items)
+        render_timeline(content_store.get("internships"))
         
     with tab3:
         # 🔑 FIX: Direct Python rendering of each item inside the timeline container
-        render_timeline(certification_items)
+        render_timeline(content_store.get("certifications"))
 
 # The resume download card (cR) remains the same
 # ... (Resume download code here) ...
 
 with cR:
-    # Resume PDF download (assuming 'Resume.pdf' is available)
-    try:
-        with open("Resume.pdf", "rb") as pdf_file:
-            pdf_bytes = pdf_file.read()
-            pdf_available = True
-    except FileNotFoundError:
-        pdf_bytes = b''
-        pdf_available = False
-
-    st.markdown(
-        """
-        <style>
-        .resume-card {
-            background: linear-gradient(135deg, #1f2937, #111827);
-            border-radius: 20px;
-            padding: 30px;
-            text-align: center;
-            color: white;
-            box-shadow: 0 10px 25px rgba(0,0,0,0.3);
-            transition: transform 0.2s ease-in-out;
-            margin-bottom: 1.5rem;
-        }
-        .resume-card:hover {
-            transform: scale(1.03);
-        }
-        .resume-title {
-            font-size: 28px;
-            font-weight: bold;
-            margin-bottom: 10px;
-            color: #facc15; /* gold */
-        }
-        .resume-desc {
-            font-size: 16px;
-            color: #d1d5db;
-            margin-bottom: 20px;
-        }
-        div.stDownloadButton > button {
-            background: linear-gradient(90deg, #3b82f6, #06b6d4);
-            color: white;
-            border-radius: 12px;
-            padding: 10px 18px;
-            font-size: 16px;
-            border: none;
-            cursor: pointer;
-            transition: all 0.3s ease-in-out;
-            font-weight: 600;
-        }
-        div.stDownloadButton > button:hover {
-            background: linear-gradient(90deg, #06b6d4, #3b82f6);
-            transform: translateY(-3px);
-            box-shadow: 0px 8px 15px rgba(0,0,0,0.3);
-        }
-        </style>
-        """,
-        unsafe_allow_html=True
-    )
-
-    st.markdown(
-        """
-        <div class="resume-card">
-            <h3 class="resume-title">📄 My Resume</h3>
-            <p class="resume-desc">Download a concise, elegant 1-page resume to know more about my journey.</p>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
-    if pdf_available:
-        st.download_button("⬇️ Download Resume", data=pdf_bytes, file_name="Resume.pdf", mime="application/pdf", use_container_width=True)
+    # Resume PDF download (assuming 'Resume.pdf' is available). Nothing is read
+    # here: static modes link to a content-hashed copy, inline mode hands
+    # download_button a callable that only runs when the button is clicked.
+    RESUME_PATH = "Resume.pdf"
+    pdf_available = os.path.isfile(RESUME_PATH)
+
+    def resume_pdf():
+        # Runs on click, possibly after the file was removed; Streamlit turns
+        # the error into a failed download instead of an empty PDF
+        asset = asset_cache.get(RESUME_PATH)
+        if asset is None:
+            raise FileNotFoundError(f"{RESUME_PATH} is no longer available")
+        return asset.data
+
+    # Card and button styles are in styles/resume.css
+    st.markdown(cards.RESUME_CARD_HTML, unsafe_allow_html=True)
+    if pdf_available and asset_mode != "inline":
+        resume_url = asset_url(RESUME_PATH, mode=asset_mode)
+        st.markdown(cards.resume_link_html(resume_url), unsafe_allow_html=True)
+    elif pdf_available:
+        # Bytes come from the process-wide asset cache (invalidated on mtime)
+        st.download_button(
+            "⬇️ Download Resume",
+            data=resume_pdf,
+            file_name="Resume.pdf",
+            mime="application/pdf",
+            on_click="ignore",
+            use_container_width=True,
+        )
     else:
         st.error("Resume.pdf file not found in the current directory.")
 
@@ -656,64 +313,76 @@ st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
 # =========================
 # Final Contact Section (Form)
 # =========================
+section_timing.page_section("Contact")
 st.markdown('<a id="contact"></a>', unsafe_allow_html=True)
 st.markdown("## Get In Touch 📧")
 st.caption("Let’s build something great together. I’m open to new opportunities.")
 
 contact_left, contact_right = st.columns([1.1, 1], gap="large")
 
+# Submitting the form reruns only this fragment
+@st.fragment
+def contact_form():
+    with section_timing.timed("Contact form"):
+        st.markdown("### Send a Message")
+        with st.form("contact_form", clear_on_submit=True):
+            st.markdown('<div class="card">', unsafe_allow_html=True)
+            name = st.text_input("Your Name *")
+            email = st.text_input("Email *")
+            msg = st.text_area("Message *", height=140)
+            sent = st.form_submit_button("Send Message ✉️", use_container_width=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+            if sent:
+                if not (name and email and msg):
+                    st.warning("Please fill in all required fields.")
+                else:
+                    # Mailto link logic on submission
+                    mailto_link = f"mailto:anshkedia.04@gmail.com?subject=Portfolio%20Contact%20from%20{name}&body={msg}%0A%0AFrom:%20{email}"
+                    st.success("Thanks! Your default email app will open to send the message. Check your pop-up blocker.")
+                    st.markdown(f"**<a class='btn btn-ghost' href='{mailto_link}'>Click here if your email didn't open automatically</a>**", unsafe_allow_html=True)
+    if debug:
+        section_timing.caption("Contact form")
+
 with contact_left:
-    st.markdown("### Send a Message")
-    with st.form("contact_form", clear_on_submit=True):
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        name = st.text_input("Your Name *")
-        email = st.text_input("Email *")
-        msg = st.text_area("Message *", height=140)
-        sent = st.form_submit_button("Send Message ✉️", use_container_width=True)
-        st.markdown('</div>', unsafe_allow_html=True)
-        if sent:
-            if not (name and email and msg):
-                st.warning("Please fill in all required fields.")
-            else:
-                # Mailto link logic on submission
-                mailto_link = f"mailto:anshkedia.04@gmail.com?subject=Portfolio%20Contact%20from%20{name}&body={msg}%0A%0AFrom:%20{email}"
-                st.success("Thanks! Your default email app will open to send the message. Check your pop-up blocker.")
-                st.markdown(f"**<a class='btn btn-ghost' href='{mailto_link}'>Click here if your email didn't open automatically</a>**", unsafe_allow_html=True)
+    contact_form()
 
 
 with contact_right:
     st.markdown("### My Socials")
-    st.markdown(
-        """
-        <div class="card card-hover">
-          <p style="color:var(--muted)">Feel free to connect with me on these platforms:</p>
-          <div style="display:grid; gap:.5rem; margin-top:.8rem;">
-            <a class="btn btn-primary" href="https://www.linkedin.com/in/ansh-kedia-249843266/" target="_blank">
-                <img src="https://cdn.jsdelivr.net/gh/devicons/devicon/icons/linkedin/linkedin-original.svg" alt="LinkedIn" width="20" height="20">
-                LinkedIn
-            </a>
-            <a class="btn btn-ghost" href="https://github.com/anshkedia-04" target="_blank">
-                <img src="https://cdn.jsdelivr.net/gh/devicons/devicon/icons/github/github-original.svg" alt="GitHub" width="20" height="20">
-                GitHub
-            </a>
-            <a class="btn btn-ghost" href="mailto:anshkedia.04@gmail.com">
-                <span style="font-size: 1.2rem;">✉️</span> Email Directly
-            </a>
-          </div>
-        </div>
-        """,
-        unsafe_allow_html=True
-    )
+    st.markdown(cards.SOCIALS_HTML, unsafe_allow_html=True)
+
+# =========================
+# Assistant (RAG chatbot)
+# =========================
+section_timing.page_section("Assistant")
+# Questions rerun only the assistant
+@st.fragment
+def assistant():
+    with section_timing.timed("Assistant chat"):
+        chatbot.chatbot()
+    if debug:
+        section_timing.caption("Assistant chat")
+
+if chatbot.available():
+    st.markdown('<div class="hr"></div>', unsafe_allow_html=True)
+    assistant()
 
 # =========================
 # Footer
 # =========================
+section_timing.page_section("Footer")
 st.write("")
-st.markdown(
-    f"""
-    <div class="footer" style="text-align:center; margin:2rem 0 1rem 0;">
-      © {datetime.now().year} Ansh Kedia • Built with Streamlit & ❤️
-    </div>
-    """,
-    unsafe_allow_html=True
-)
\ No newline at end of file
+if debug:
+    rerun = fragment_cache.rerun_stats()
+    st.caption(f"HTML fragments this rerun: {rerun['builds']} built, {rerun['hits']} reused")
+    answers = chatbot.answer_cache_stats()
+    if answers:
+        st.caption(
+            f"Answer cache: {answers['exact_hits']} exact + {answers['semantic_hits']} semantic hits, "
+            f"{answers['misses']} misses ({answers['hit_rate']:.0%} hit rate), {answers['entries']} entries"
+        )
+    st.markdown(f"**Section timings** (full page runs: {section_timing.page_runs()})\n\n" + section_timing.table())
+st.markdown(cards.footer_html(datetime.now().year), unsafe_allow_html=True)
+section_timing.end_page()
+if profiling:
+    section_timing.overlay()
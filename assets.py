@@ -0,0 +1,618 @@
+# assets.py
+# -------------------------------------------------------
+# Process-wide cache for the local image assets (logos,
+# project covers) that app.py inlines into its HTML.
+# Streamlit re-executes app.py on every interaction, but
+# imported modules live for the whole server process, so
+# anything cached here survives reruns and sessions.
+# -------------------------------------------------------
+
+import base64
+import hashlib
+import json
+import logging
+import mimetypes
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("image/avif", ".avif")
+
+DEFAULT_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_REVALIDATE_SECONDS = 5.0
+
+# Display sizes used by app.py (CSS px); optimize_images.py builds 1x/2x for these.
+LOGO_SIZE = 40
+COVER_WIDTH = 400
+
+VARIANTS_DIR = "static/img"
+MANIFEST_PATH = os.path.join(VARIANTS_DIR, "manifest.json")
+# Formats offered as <picture> sources, most preferred first; browsers take the
+# first they can decode and fall back to the original file.
+ACCEPTED_FORMATS = tuple(os.environ.get("PORTFOLIO_IMAGE_FORMATS", "avif,webp").split(","))
+# Pixel densities served through srcset (optimize_images.py builds each of them)
+DENSITIES = (1, 2)
+# Inline mode has room for one data URI per image, so it uses the format every current browser decodes
+INLINE_FORMAT = "webp"
+
+# How images reach the browser:
+#   inline - data: URIs inside the HTML (re-sent with every rerun)
+#   static - content-hashed files under static/, served by Streamlit's
+#            static file serving (.streamlit/config.toml) at app/static/
+#   server - the same files from a small local handler that sends
+#            long-lived immutable Cache-Control headers; it binds a
+#            port, so only PORTFOLIO_ASSET_MODE can select it, and
+#            it needs PORTFOLIO_STATIC_URL
+ASSET_MODES = ("inline", "static", "server")
+# Modes a visitor may pick with ?assets= (for benchmarking)
+QUERY_ASSET_MODES = ("inline", "static")
+ASSET_MODE = os.environ.get("PORTFOLIO_ASSET_MODE", "static")
+STATIC_DIR = "static"
+HASHED_SUBDIR = "_h"
+STREAMLIT_STATIC_URL = "app/static"
+# Relative URL prefix used by export_static.py (not one of ASSET_MODES: the live app never renders it)
+EXPORT_MODE = "export"
+EXPORT_STATIC_URL = "static"
+# The handler listens on loopback unless told otherwise
+STATIC_SERVER_HOST = os.environ.get("PORTFOLIO_STATIC_HOST", "127.0.0.1")
+STATIC_SERVER_PORT = int(os.environ.get("PORTFOLIO_STATIC_PORT", 8502))
+# Public URL visitors reach the handler at (reverse proxy or CDN in front of it).
+# Required for server mode: without it images are served from app/static instead.
+STATIC_SERVER_URL = os.environ.get("PORTFOLIO_STATIC_URL", "").rstrip("/")
+
+# Skill icons: vendored originals + one stylesheet, built by bundle_icons.py
+ICON_SIZE = 28
+ICONS_DIR = "icons"
+ICON_MANIFEST_PATH = os.path.join(ICONS_DIR, "manifest.json")
+ICON_STYLESHEET = os.path.join(STATIC_DIR, "icons", "skills.css")
+
+
+class Asset:
+    """Bytes of one file, shared by every path whose content is identical."""
+
+    __slots__ = ("digest", "mime", "data", "_b64")
+
+    def __init__(self, digest, mime, data):
+        self.digest = digest
+        self.mime = mime
+        self.data = data
+        self._b64 = None
+
+    @property
+    def b64(self):
+        # AssetCache memoizes the encoding (and accounts for its bytes).
+        if self._b64 is not None:
+            return self._b64
+        return base64.b64encode(self.data).decode()
+
+    @property
+    def data_uri(self):
+        return f"data:{self.mime};base64,{self.b64}"
+
+    @property
+    def nbytes(self):
+        # Raw bytes plus the base64 text once it has been built.
+        return len(self.data) + (len(self._b64) if self._b64 else 0)
+
+
+class AssetCache:
+    """LRU cache of file contents keyed by (path, mtime, size).
+
+    Files with identical content are stored once (deduped by SHA-256).
+    Entries are evicted least-recently-used first once the cached bytes
+    exceed ``max_bytes``. A path is only re-``stat``-ed after
+    ``revalidate_seconds``, so hot reruns touch neither disk nor encoder.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, revalidate_seconds=DEFAULT_REVALIDATE_SECONDS):
+        self.max_bytes = max_bytes
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._paths = {}              # path -> (checked_at, (mtime_ns, size), digest)
+        self._blobs = OrderedDict()   # digest -> Asset, oldest first
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ---------- lookups ----------
+    def get(self, path):
+        """Return the Asset for ``path``, or None if the file is missing."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._paths.get(path)
+            if entry and now - entry[0] < self.revalidate_seconds and entry[2] in self._blobs:
+                return self._hit(entry[2])
+
+        try:
+            st = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._paths.pop(path, None)
+            return None
+        key = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._paths.get(path)
+            if entry and entry[1] == key and entry[2] in self._blobs:
+                self._paths[path] = (now, key, entry[2])
+                return self._hit(entry[2])
+
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        mime = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        with self._lock:
+            self.misses += 1
+            self._paths[path] = (now, key, digest)
+            asset = self._blobs.get(digest)
+            if asset is None:
+                asset = Asset(digest, mime, data)
+                self._blobs[digest] = asset
+                self._bytes += len(data)
+            self._blobs.move_to_end(digest)
+            self._evict()
+            return asset
+
+    def data_uri(self, path):
+        """``data:`` URI for ``path`` (empty string if the file is missing)."""
+        asset = self.get(path)
+        if asset is None:
+            return ""
+        if asset._b64 is None:
+            with self._lock:
+                if asset._b64 is None:
+                    asset._b64 = base64.b64encode(asset.data).decode()
+                    if asset.digest in self._blobs:
+                        self._bytes += len(asset._b64)
+                        self._evict()
+        return asset.data_uri
+
+    def b64(self, path):
+        """Base64 text of ``path`` (empty string if the file is missing)."""
+        uri = self.data_uri(path)
+        return uri.split(",", 1)[1] if uri else ""
+
+    # ---------- bookkeeping ----------
+    def _hit(self, digest):
+        self.hits += 1
+        self._blobs.move_to_end(digest)
+        return self._blobs[digest]
+
+    def _evict(self):
+        # Always keep the most recent entry, even if it alone is over budget.
+        while self._bytes > self.max_bytes and len(self._blobs) > 1:
+            _, asset = self._blobs.popitem(last=False)
+            self._bytes -= asset.nbytes
+            self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._paths.clear()
+            self._blobs.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._blobs),
+                "paths": len(self._paths),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+# One cache per server process; size it with PORTFOLIO_ASSET_CACHE_BYTES.
+asset_cache = AssetCache(
+    max_bytes=int(os.environ.get("PORTFOLIO_ASSET_CACHE_BYTES", DEFAULT_MAX_BYTES)),
+)
+
+
+# =========================
+# Optimized image variants
+# =========================
+class VariantManifest:
+    """Reads the manifest written by optimize_images.py.
+
+    The manifest is re-read when its mtime changes. A source whose bytes no
+    longer match the recorded SHA-256 is treated as stale and served as-is.
+    Like AssetCache, the manifest and each source's variants are checked at
+    most once per ``revalidate_seconds``.
+    """
+
+    def __init__(self, path=MANIFEST_PATH, revalidate_seconds=DEFAULT_REVALIDATE_SECONDS):
+        self.path = path
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._checked = None
+        self._mtime = None
+        self._sources = {}
+        self._fresh = {}      # (path, mtime_ns, size) -> bool
+        self._available = {}  # source path -> (checked at, variants on disk, [] if stale)
+
+    def _load(self, now):
+        if self._checked is not None and now - self._checked < self.revalidate_seconds:
+            return
+        self._checked = now
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            self._mtime, self._sources = None, {}
+            self._available.clear()
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            with open(self.path) as f:
+                self._sources = json.load(f).get("sources", {})
+        except (OSError, ValueError):
+            self._sources = {}
+        self._mtime = mtime
+        self._fresh.clear()
+        self._available.clear()
+
+    def _is_fresh(self, path, entry):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        key = (path, st.st_mtime_ns, st.st_size)
+        fresh = self._fresh.get(key)
+        if fresh is None:
+            if st.st_size != entry.get("bytes"):
+                fresh = False
+            else:
+                h = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 16), b""):
+                        h.update(block)
+                fresh = h.hexdigest() == entry.get("sha256")
+            self._fresh[key] = fresh
+        return fresh
+
+    def _variants(self, path, formats):
+        key = path.replace(os.sep, "/")
+        now = time.monotonic()
+        with self._lock:
+            self._load(now)
+            cached = self._available.get(key)
+            if cached is None or now - cached[0] >= self.revalidate_seconds:
+                entry = self._sources.get(key)
+                if entry and self._is_fresh(path, entry):
+                    variants = [v for v in entry["variants"] if os.path.exists(v["path"])]
+                else:
+                    variants = []
+                cached = self._available[key] = (now, variants)
+        return [v for v in cached[1] if v["format"] in formats]
+
+    def pick(self, path, width, density=2, formats=ACCEPTED_FORMATS):
+        """Smallest variant of ``path`` at least ``width * density`` px wide.
+
+        Falls back to the widest variants when none is large enough, and
+        returns None when there is no fresh variant at all.
+        """
+        return self._best(self._variants(path, formats), width * density)
+
+    def srcsets(self, path, width, densities=DENSITIES, formats=ACCEPTED_FORMATS):
+        """[(format, [(density, variant path), ...]), ...] in ``formats`` order.
+
+        Densities whose best variant is the same file as a lower density's
+        are dropped. Empty when there is no fresh variant.
+        """
+        variants = self._variants(path, formats)
+        out = []
+        for fmt in formats:
+            candidates = []
+            for density in densities:
+                best = self._best([v for v in variants if v["format"] == fmt], width * density)
+                if best and best not in (p for _, p in candidates):
+                    candidates.append((density, best))
+            if candidates:
+                out.append((fmt, candidates))
+        return out
+
+    @staticmethod
+    def _best(variants, need):
+        if not variants:
+            return None
+        suitable = [v for v in variants if v["width"] >= need]
+        if not suitable:
+            widest = max(v["width"] for v in variants)
+            suitable = [v for v in variants if v["width"] == widest]
+        return min(suitable, key=lambda v: v["bytes"])["path"]
+
+
+variant_manifest = VariantManifest()
+
+
+# =========================
+# Skill icon bundle
+# =========================
+class IconBundle:
+    """Reads the manifest written by bundle_icons.py (re-read when its mtime changes).
+
+    Every skill card asks for its class, so the manifest is stat'ed at most
+    once per ``revalidate_seconds``.
+    """
+
+    def __init__(self, path=ICON_MANIFEST_PATH, revalidate_seconds=DEFAULT_REVALIDATE_SECONDS):
+        self.path = path
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._checked = None
+        self._mtime = None
+        self._icons = {}
+        self._stylesheet = None
+        self._stylesheet_exists = False
+
+    def _load(self):
+        now = time.monotonic()
+        if self._checked is not None and now - self._checked < self.revalidate_seconds:
+            return
+        self._checked = now
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            self._mtime, self._icons, self._stylesheet, self._stylesheet_exists = None, {}, None, False
+            return
+        if mtime != self._mtime:
+            try:
+                with open(self.path) as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError):
+                manifest = {}
+            self._icons = manifest.get("icons", {})
+            self._stylesheet = manifest.get("stylesheet")
+            self._mtime = mtime
+        self._stylesheet_exists = bool(self._stylesheet) and os.path.exists(self._stylesheet)
+
+    @property
+    def version(self):
+        """Changes whenever the bundle is rebuilt (a cache key for rendered HTML)."""
+        with self._lock:
+            self._load()
+            return self._mtime, self._stylesheet_exists
+
+    def icon_class(self, url):
+        """CSS class drawing the icon for ``url``, or None if it is not bundled."""
+        with self._lock:
+            self._load()
+            entry = self._icons.get(url)
+            if not entry or not self._stylesheet_exists:
+                return None
+            return entry["class"]
+
+    @property
+    def stylesheet(self):
+        """Path of the built icon stylesheet (theme.py folds it into the site CSS), or None."""
+        with self._lock:
+            self._load()
+            return self._stylesheet if self._icons and self._stylesheet_exists else None
+
+
+icon_bundle = IconBundle()
+
+
+# =========================
+# Static serving
+# =========================
+class ImmutableStaticHandler(SimpleHTTPRequestHandler):
+    """Serves the content-hashed files of static/_h/ with far-future caching; no listings."""
+
+    def send_response(self, code, message=None):
+        self._status = code
+        super().send_response(code, message)
+
+    def list_directory(self, path):
+        self.send_error(404, "File not found")
+        return None
+
+    def end_headers(self):
+        if getattr(self, "_status", None) == 200:
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("X-Content-Type-Options", "nosniff")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+_published = set()
+_static_server = None
+_static_server_failed = False
+_static_lock = threading.Lock()
+
+
+def start_static_server(host=STATIC_SERVER_HOST, port=STATIC_SERVER_PORT):
+    """Start the local static handler once per process (daemon thread).
+
+    Only static/_h/ is served, at the handler's root. Returns None if
+    PORTFOLIO_STATIC_URL is unset or the port can't be bound; the failure is
+    logged once and not retried, and asset_url serves through Streamlit instead.
+    """
+    global _static_server, _static_server_failed
+    with _static_lock:
+        if _static_server is None and not _static_server_failed:
+            if not STATIC_SERVER_URL:
+                _static_server_failed = True
+                logger.warning("Server asset mode needs PORTFOLIO_STATIC_URL (the handler's public URL); serving from app/static")
+                return None
+            handler = partial(ImmutableStaticHandler, directory=os.path.abspath(os.path.join(STATIC_DIR, HASHED_SUBDIR)))
+            try:
+                _static_server = ThreadingHTTPServer((host, port), handler)
+            except OSError as e:
+                _static_server_failed = True
+                logger.warning("Static asset server could not bind %s:%d (%s); serving from app/static", host, port, e)
+                return None
+            threading.Thread(target=_static_server.serve_forever, name="static-assets", daemon=True).start()
+    return _static_server
+
+
+def publish(path):
+    """Copy ``path`` to static/_h/ under a content-hashed name.
+
+    Returns the name relative to static/, or None if ``path`` is missing.
+    Each content hash is written at most once per process.
+    """
+    asset = asset_cache.get(path)
+    if asset is None:
+        return None
+    stem, ext = os.path.splitext(os.path.basename(path))
+    name = f"{HASHED_SUBDIR}/{stem}.{asset.digest[:12]}{ext}"
+    if name not in _published:
+        dest = os.path.join(STATIC_DIR, name)
+        if not os.path.exists(dest):
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            tmp = f"{dest}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(asset.data)
+            os.replace(tmp, dest)
+        _published.add(name)
+    return name
+
+
+def asset_url(path, mode=None):
+    """URL for ``path`` in the given asset mode ("" if the file is missing)."""
+    mode = mode or ASSET_MODE
+    if mode == "inline":
+        return asset_cache.data_uri(path)
+    name = publish(path)
+    if name is None:
+        return ""
+    if mode == "server" and start_static_server():
+        return f"{STATIC_SERVER_URL}/{name[len(HASHED_SUBDIR) + 1:]}"
+    if mode == EXPORT_MODE:
+        return f"{EXPORT_STATIC_URL}/{name}"
+    return f"{STREAMLIT_STATIC_URL}/{name}"
+
+
+def image_src(path, width, density=2, mode=None, formats=ACCEPTED_FORMATS):
+    """``src`` for an image shown ``width`` px wide, using its smallest variant."""
+    return asset_url(variant_manifest.pick(path, width, density, formats) or path, mode)
+
+
+# =========================
+# Image resolver
+# =========================
+# This checkout's <owner>/<repo> on GitHub; only blob URLs into it map to local files
+GITHUB_REPO = os.environ.get("PORTFOLIO_GITHUB_REPO", "anshkedia-04/Portfolio_Streamlit")
+# https://github.com/<owner>/<repo>/blob/<ref>/<path>?raw=true
+GITHUB_BLOB_RE = re.compile(r"^https://github\.com/([^/]+)/([^/]+)/blob/([^/]+)/([^?#]+)(?:\?raw=true)?$")
+
+
+def _locate(ref, mode):
+    """``(local path, remote URL)`` for an image reference; at most one is set.
+
+    GitHub blob URLs that point into this repository are mapped back to the
+    checked-out file. Inline mode and files that are not on disk fall back to
+    the remote, using the raw.githubusercontent.com URL that ``?raw=true``
+    would redirect to.
+    """
+    m = GITHUB_BLOB_RE.match(ref)
+    if not m:
+        if os.path.isfile(ref):
+            return ref, None
+        return None, ref if ref.startswith(("http://", "https://")) else None
+    owner, repo, branch, path = m.groups()
+    local = f"{owner}/{repo}".lower() == GITHUB_REPO.lower()
+    if local and mode != "inline" and os.path.isfile(path):
+        return path, None
+    return None, f"https://raw.githubusercontent.com/{owner}/{repo}/{branch}/{path}"
+
+
+def image_sources(ref, width, mode=None):
+    """``(sources, src)`` for an image shown ``width`` px wide.
+
+    ``sources`` holds one ``(mime type, srcset)`` pair per variant format, most
+    preferred first, with 1x and 2x candidates; ``src`` is the fallback for
+    browsers that take none of them (the original file, or the remote URL for
+    images not served locally). Inline mode has no sources and embeds the
+    INLINE_FORMAT variant instead. ``src`` is "" when the image is missing.
+    """
+    mode = mode or ASSET_MODE
+    path, remote = _locate(ref, mode)
+    if path is None:
+        return [], remote or ""
+    if mode == "inline":
+        return [], image_src(path, width, DENSITIES[-1], mode, (INLINE_FORMAT,))
+    sources = [
+        (f"image/{fmt}", ", ".join(f"{asset_url(p, mode)} {d}x" for d, p in candidates))
+        for fmt, candidates in variant_manifest.srcsets(path, width)
+    ]
+    return sources, asset_url(path, mode)
+
+
+_image_keys = {}   # (ref, width, mode) -> (checked at, key)
+_image_keys_lock = threading.Lock()
+
+
+def image_key(ref, width, mode=None):
+    """Hashable stand-in for what ``ref`` resolves to now, for keying cached markup.
+
+    Names the files image_sources would serve with their content digests, so
+    it changes when the image, its variants or their freshness change.
+    Memoized per (ref, width, mode) and re-derived at most once per
+    asset_cache.revalidate_seconds, so hot reruns don't touch the disk.
+    """
+    mode = mode or ASSET_MODE
+    now = time.monotonic()
+    with _image_keys_lock:
+        cached = _image_keys.get((ref, width, mode))
+    if cached and now - cached[0] < asset_cache.revalidate_seconds:
+        return cached[1]
+    path, remote = _locate(ref, mode)
+    if path is None:
+        key = remote
+    else:
+        paths = [p for _, candidates in variant_manifest.srcsets(path, width) for _, p in candidates] + [path]
+        key = []
+        for p in paths:
+            asset = asset_cache.get(p)
+            if asset is not None:
+                key.append((p, asset.digest))
+        key = tuple(key)
+    with _image_keys_lock:
+        _image_keys[(ref, width, mode)] = (now, key)
+    return key
+
+
+def picture_html(ref, width, attrs="", mode=None):
+    """``<picture>`` with a typed ``<source>`` per variant format ("" if the image is missing)."""
+    sources, src = image_sources(ref, width, mode)
+    if not src:
+        return ""
+    img = f'<img src="{src}" {attrs}/>'
+    if not sources:
+        return img
+    return "<picture>" + "".join(f'<source type="{t}" srcset="{s}">' for t, s in sources) + img + "</picture>"
+
+
+def preload_html(ref, width, mode=None):
+    """``<link rel=preload>`` for the source a browser would pick first ("" for data URIs)."""
+    sources, src = image_sources(ref, width, mode)
+    if sources:
+        # Browsers that can't decode the type skip the hint rather than fetch the wrong file
+        mime, srcset = sources[0]
+        return f'<link rel="preload" as="image" type="{mime}" imagesrcset="{srcset}">'
+    if src and not src.startswith("data:"):
+        return f'<link rel="preload" as="image" href="{src}">'
+    return ""
@@ -0,0 +1,101 @@
+# benchmarks/llm_backends.py
+# -------------------------------------------------------
+# Compares the chatbot LLM backends (llm_backends.py) on
+# load time, per-answer latency and resident memory. Each
+# backend runs in its own subprocess so RSS is not shared.
+#
+#   python benchmarks/llm_backends.py
+#   python benchmarks/llm_backends.py --backends torch int8 --runs 10 --json out.json
+# -------------------------------------------------------
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+PROMPTS = [
+    "question: What are Ansh's skills? context: Python, TensorFlow, scikit-learn, OpenCV, LangChain.",
+    "question: Where did Ansh intern in 2025? context: Data Science Summer Intern at Celebal Technologies.",
+    "question: What is BrickWise? context: A regression pipeline that predicts Bengaluru house prices.",
+]
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def worker(backend, model_name, runs):
+    from llm_backends import build_pipeline
+
+    base = rss_mb()
+    t0 = time.perf_counter()
+    pipe = build_pipeline(model_name, backend)
+    load_s = time.perf_counter() - t0
+    pipe(PROMPTS[0])  # warm-up
+
+    latencies = []
+    for i in range(runs):
+        t0 = time.perf_counter()
+        pipe(PROMPTS[i % len(PROMPTS)])
+        latencies.append(time.perf_counter() - t0)
+    latencies.sort()
+    return {
+        "backend": backend,
+        "load_s": load_s,
+        "latency_p50_s": statistics.median(latencies),
+        "latency_p95_s": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))],
+        "rss_mb": rss_mb(),
+        "rss_model_mb": rss_mb() - base,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def main():
+    from llm_backends import BACKENDS
+
+    parser = argparse.ArgumentParser(description="Benchmark chatbot LLM backends.")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--model", default="google/flan-t5-base")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.model, args.runs)))
+        return
+
+    results = []
+    for backend in args.backends:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--worker", backend, "--model", args.model, "--runs", str(args.runs)],
+            capture_output=True, text=True, cwd=ROOT,
+        )
+        if proc.returncode != 0:
+            err = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+            results.append({"backend": backend, "error": err})
+        else:
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+    print(f"{'backend':<8} {'load s':>8} {'p50 s':>8} {'p95 s':>8} {'RSS MB':>8} {'model MB':>9}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['backend']:<8} error: {r['error']}")
+        else:
+            print(f"{r['backend']:<8} {r['load_s']:8.2f} {r['latency_p50_s']:8.3f} {r['latency_p95_s']:8.3f} {r['rss_mb']:8.0f} {r['rss_model_mb']:9.0f}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"model": args.model, "runs": args.runs, "results": results}, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
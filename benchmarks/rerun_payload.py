@@ -0,0 +1,108 @@
+# benchmarks/rerun_payload.py
+# -------------------------------------------------------
+# Bytes app.py sends per rerun: the serialized size of
+# every element delta (streamlit protobufs) for a full page
+# run, grouped by element type, with the largest elements
+# listed. Runs headless via streamlit AppTest.
+#
+#   python benchmarks/rerun_payload.py
+#   python benchmarks/rerun_payload.py --baseline HEAD~1   # before/after
+#   python benchmarks/rerun_payload.py --assets inline --json out.json
+# -------------------------------------------------------
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEASURE = """
+import json, sys
+from streamlit.testing.v1 import AppTest
+sys.path.insert(0, {root!r})
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.query_params["assets"] = {assets!r}
+at.run()
+at.run()   # the second run is the steady-state rerun
+rows = []
+def walk(node):
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        preview = getattr(proto, "body", "") or ""
+        rows.append((type(node).__name__, proto.ByteSize(), preview[:60].replace("\\n", " ")))
+    children = getattr(node, "children", None)
+    if isinstance(children, dict):
+        for child in children.values():
+            walk(child)
+walk(at._tree)
+print("RESULT " + json.dumps({{"rows": rows, "exceptions": len(at.exception)}}))
+"""
+
+
+def measure(root, assets):
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", MEASURE.format(root=root, app=os.path.join(root, "app.py"), assets=assets)],
+        cwd=root, capture_output=True, text=True,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith("RESULT "):
+            return json.loads(line[len("RESULT "):])
+    raise RuntimeError(f"app run failed in {root}:\n{proc.stderr[-2000:]}")
+
+
+def checkout(ref, dest):
+    """Export ``ref`` of this repository into ``dest`` (no worktree metadata)."""
+    archive = subprocess.run(["git", "archive", "--format=tar", ref], cwd=ROOT, capture_output=True, check=True).stdout
+    with tempfile.TemporaryFile() as f:
+        f.write(archive)
+        f.seek(0)
+        with tarfile.open(fileobj=f) as tar:
+            tar.extractall(dest)
+
+
+def summarize(result):
+    by_type = Counter()
+    for kind, nbytes, _ in result["rows"]:
+        by_type[kind] += nbytes
+    return {"total_bytes": sum(by_type.values()), "elements": len(result["rows"]), "by_type": dict(by_type.most_common())}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-rerun delta payload of app.py, optionally against a git ref.")
+    parser.add_argument("--baseline", help="git ref to compare against (e.g. HEAD~1)")
+    parser.add_argument("--assets", default="static", choices=["inline", "static", "server"])
+    parser.add_argument("--top", type=int, default=8, help="largest elements to list")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    current = measure(ROOT, args.assets)
+    report = {"assets": args.assets, "current": summarize(current)}
+    print(f"Rerun payload ({args.assets} assets): {report['current']['total_bytes']:,} bytes in {report['current']['elements']} elements")
+    for kind, nbytes in report["current"]["by_type"].items():
+        print(f"  {kind:<20} {nbytes:>9,}")
+    print(f"\nLargest elements:")
+    for kind, nbytes, preview in sorted(current["rows"], key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"  {nbytes:>8,}  {kind:<12} {preview}")
+
+    if args.baseline:
+        with tempfile.TemporaryDirectory() as tmp:
+            checkout(args.baseline, tmp)
+            report["baseline"] = summarize(measure(tmp, args.assets))
+        before, after = report["baseline"]["total_bytes"], report["current"]["total_bytes"]
+        report["saved_bytes"] = before - after
+        print(f"\n{args.baseline}: {before:,} bytes -> working tree: {after:,} bytes "
+              f"({before - after:+,} saved, {100 * (before - after) / before:.1f}%)")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(1 if current["exceptions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# benchmarks/startup.py
+# -------------------------------------------------------
+# Cold-start diagnostics for app.py:
+#   1. import-time profile (python -X importtime) of the
+#      modules app.py imports, heaviest first
+#   2. cold start to first paint: a fresh interpreter runs
+#      the page once (streamlit AppTest); the time from
+#      process launch to the finished run is compared with
+#      the budget and the script exits 1 when it is over
+#
+#   python benchmarks/startup.py
+#   python benchmarks/startup.py --top 30 --budget 2.5 --json out.json
+# -------------------------------------------------------
+
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from section_timing import COLD_START_BUDGET  # noqa: E402
+
+APP = os.path.join(ROOT, "app.py")
+_IMPORTTIME = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+FIRST_PAINT = """
+import time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({app!r}, default_timeout=120).run()
+print("RESULT", time.perf_counter() - t0, len(at.exception))
+"""
+
+
+def app_imports(path=APP):
+    """Top-level modules app.py imports (in order)."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names += [a.name for a in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.append(node.module)
+    return list(dict.fromkeys(names))
+
+
+def import_profile(modules):
+    """[(module, self_ms, cumulative_ms, depth)] for one cold ``import`` of ``modules``."""
+    code = "; ".join(f"import {m}" for m in modules)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-W", "ignore", "-c", code],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = _IMPORTTIME.match(line)
+        if m:
+            depth = (len(m.group(3)) - 1) // 2
+            rows.append((m.group(4), int(m.group(1)) / 1000, int(m.group(2)) / 1000, depth))
+    return rows
+
+
+def first_paint():
+    """Seconds from launching a fresh interpreter to the end of the first page run."""
+    t0 = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", FIRST_PAINT.format(app=APP)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    total = time.perf_counter() - t0
+    for line in proc.stdout.splitlines():
+        if line.startswith("RESULT"):
+            _, run_s, errors = line.split()
+            return {"first_paint_s": total, "page_run_s": float(run_s), "exceptions": int(errors)}
+    raise RuntimeError(f"app run failed:\n{proc.stderr[-2000:]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time profile and cold-start budget check for app.py.")
+    parser.add_argument("--top", type=int, default=20, help="modules to list in the import profile")
+    parser.add_argument("--budget", type=float, default=COLD_START_BUDGET, help="cold start to first paint, seconds")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    modules = app_imports()
+    rows = import_profile(modules)
+    direct = {r[0]: r for r in rows if r[0] in modules}
+    print(f"Imports in app.py ({sum(r[2] for r in direct.values()):.0f} ms cumulative):")
+    for name in modules:
+        if name in direct:
+            print(f"  {name:<32} {direct[name][2]:9.1f} ms")
+    print(f"\nHeaviest modules by self time (top {args.top} of {len(rows)}):")
+    print(f"  {'module':<48} {'self ms':>9} {'cum ms':>9}")
+    for name, self_ms, cum_ms, _ in sorted(rows, key=lambda r: r[1], reverse=True)[:args.top]:
+        print(f"  {name:<48} {self_ms:9.1f} {cum_ms:9.1f}")
+
+    paint = first_paint()
+    over = paint["first_paint_s"] > args.budget
+    print(f"\nCold start to first paint: {paint['first_paint_s']:.2f}s "
+          f"(page run {paint['page_run_s']:.2f}s, budget {args.budget:.2f}s) -> {'OVER BUDGET' if over else 'ok'}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({
+                "imports": [{"module": n, "self_ms": s, "cumulative_ms": c, "depth": d} for n, s, c, d in rows],
+                "budget_s": args.budget,
+                **paint,
+            }, f, indent=2)
+    sys.exit(1 if over or paint["exceptions"] else 0)
+
+
+if __name__ == "__main__":
+    main()
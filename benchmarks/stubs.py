@@ -0,0 +1,59 @@
+# benchmarks/stubs.py
+# -------------------------------------------------------
+# Offline stand-ins for the chatbot's models, so benchmarks
+# time our own code (parsing, indexing, retrieval, chain,
+# UI) without downloading or running MiniLM / flan-t5:
+#   HashEmbeddings  deterministic bag-of-words vectors with
+#                   the same width as all-MiniLM-L6-v2
+#   stub_llm        langchain's fake streaming LLM with a
+#                   fixed answer and optional per-char delay
+# install() swaps them into chatbot's cached loaders. Set
+# CHATBOT_INDEX_DIR before importing chatbot so the real
+# saved index is left alone.
+# -------------------------------------------------------
+
+import hashlib
+import math
+import re
+
+import streamlit as st
+from langchain_core.embeddings import Embeddings
+
+DIMENSIONS = 384
+ANSWER = "Ansh works with Python, scikit-learn, TensorFlow and LangChain, and interned at Celebal Technologies."
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class HashEmbeddings(Embeddings):
+    """Feature-hashed token counts, L2-normalised: related texts land close together."""
+
+    def __init__(self, dimensions=DIMENSIONS):
+        self.dimensions = dimensions
+        self.calls = 0
+
+    def embed_query(self, text):
+        vector = [0.0] * self.dimensions
+        for token in _TOKEN.findall(text.lower()):
+            h = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "little")
+            vector[h % self.dimensions] += 1.0 if (h >> 63) else -1.0
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return [v / norm for v in vector]
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return [self.embed_query(t) for t in texts]
+
+
+def stub_llm(char_delay=0.0):
+    from langchain_community.llms.fake import FakeStreamingListLLM
+
+    return FakeStreamingListLLM(responses=[ANSWER], sleep=char_delay or None)
+
+
+def install(char_delay=0.0):
+    """Point chatbot's embedder and LLM loaders at the stubs (process-wide)."""
+    import chatbot
+
+    chatbot.load_embeddings = st.cache_resource(lambda: HashEmbeddings())
+    chatbot.load_llm = st.cache_resource(lambda *args, **kwargs: stub_llm(char_delay))
+    return chatbot
@@ -0,0 +1,411 @@
+# benchmarks/suite.py
+# -------------------------------------------------------
+# Headless benchmark suite for app.py and the chatbot, run
+# through streamlit AppTest with no network: the embedder
+# and LLM are stubs (benchmarks/stubs.py), HF downloads are
+# disabled and the chatbot index goes to a temp directory.
+#
+#   cold     fresh interpreter to the end of the first page run
+#   page     rerun latency: plain rerun, project search, tag
+#            filter, timeline (tabs) and resume sections, both
+#            asset modes
+#   memory   Python heap (tracemalloc) and RSS per simulated
+#            session, with the process caches already warm
+#   chatbot  index build / reload, retrieval, chain overhead,
+#            streamed answer, and a question through chatbot()
+#
+# Each group runs in its own subprocess. Results are written
+# as JSON (schema 1): one record per metric with a fixed name,
+# unit and n/mean/p50/p95/min/max, so runs can be diffed.
+#
+#   python benchmarks/suite.py --json bench.json
+#   python benchmarks/suite.py --only page chatbot --runs 20
+#   python benchmarks/suite.py --compare bench.json   # exit 1 on regressions
+# -------------------------------------------------------
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+SCHEMA = 1
+GROUPS = ("cold", "page", "memory", "chatbot")
+
+SEARCHES = ["brick", "vision", "stream", "python", "gesture", "price prediction", "zzz-no-match", ""]
+QUESTIONS = [
+    "What are Ansh's skills?",
+    "Where did Ansh intern?",
+    "Tell me about BrickWise",
+    "Which projects use computer vision?",
+    "What did Ansh study?",
+    "How can I contact Ansh?",
+]
+
+CHAT_SCRIPT = """
+import chatbot
+chatbot.chatbot()
+"""
+
+
+# =========================
+# Helpers
+# =========================
+def stats(name, samples, unit="ms", **extra):
+    """One stable result record; ``samples`` are already in ``unit``."""
+    ordered = sorted(samples)
+    record = {
+        "name": name,
+        "unit": unit,
+        "n": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": statistics.median(ordered),
+        "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "min": ordered[0],
+        "max": ordered[-1],
+    }
+    record.update(extra)
+    return record
+
+
+def timed_ms(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - t0) * 1000, result
+
+
+def rss_mb():
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def new_app(**query):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=120)
+    for key, value in query.items():
+        at.query_params[key] = value
+    return at
+
+
+def run_app(at):
+    ms, _ = timed_ms(at.run)
+    if at.exception:
+        raise RuntimeError(f"app raised: {at.exception[0].value}")
+    return ms
+
+
+def wait_for_warmup():
+    """Let the assistant's background warm-up finish so it does not skew the timings."""
+    import chatbot
+
+    while chatbot.warmup_status()["state"] == "running":
+        time.sleep(0.01)
+
+
+def section_ms(at, name):
+    return at.session_state["section_timings"][name]["last_ms"]
+
+
+# =========================
+# Groups (each runs in a worker process)
+# =========================
+def bench_cold(runs):
+    """Not a worker: launches ``runs`` fresh interpreters that each run the page once."""
+    code = (
+        "import time; t0 = time.perf_counter()\n"
+        # Appended: benchmarks/llm_backends.py must not shadow the app's module
+        f"import sys; sys.path.append({os.path.dirname(os.path.abspath(__file__))!r})\n"
+        "import chatbot, stubs\n"
+        "if chatbot.available(): stubs.install()\n"
+        "from streamlit.testing.v1 import AppTest\n"
+        f"at = AppTest.from_file({APP!r}, default_timeout=120).run()\n"
+        "print('RESULT', time.perf_counter() - t0, len(at.exception))\n"
+    )
+    first_run, process = [], []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, "-W", "ignore", "-c", code], cwd=ROOT, env=worker_env(), capture_output=True, text=True)
+        wall = time.perf_counter() - t0
+        line = next((l for l in proc.stdout.splitlines() if l.startswith("RESULT ")), None)
+        if line is None or line.split()[2] != "0":
+            raise RuntimeError(f"cold start run failed:\n{proc.stderr[-2000:]}")
+        first_run.append(float(line.split()[1]))
+        process.append(wall)
+    return [
+        stats("cold_start.first_run", first_run, "s"),
+        stats("cold_start.process", process, "s"),
+    ]
+
+
+def bench_page(runs):
+    import cards
+
+    results = []
+    for mode in ("static", "inline"):
+        at = new_app(assets=mode)
+        first = run_app(at)
+        wait_for_warmup()
+        rerun, resume = [], []
+        for _ in range(runs):
+            rerun.append(run_app(at))
+            resume.append(section_ms(at, "Resume"))
+        # All three tabs render on every run (switching is client-side); check they did
+        tabs = {tab.label: len(tab.markdown) for tab in at.tabs}
+        results += [
+            stats(f"page.{mode}.first_run", [first]),
+            stats(f"page.{mode}.rerun", rerun),
+            stats(f"page.{mode}.section.resume", resume, tabs=tabs),
+        ]
+        # Skill icons are self-hosted (bundle_icons.py); any third-party URL fails the run
+        external = [url for m in at.markdown if "skill-card" in m.value for url in cards.external_srcs(m.value)]
+        if external:
+            results.append({"name": f"page.{mode}.skill_icons", "error": f"{len(external)} loaded from third-party hosts, e.g. {external[0]}"})
+        if mode != "static":
+            continue
+
+        search = []
+        for i in range(runs):
+            _search_box(at).input(SEARCHES[i % len(SEARCHES)])
+            search.append(run_app(at))
+        _search_box(at).input("")
+        run_app(at)
+
+        tag_filter = at.segmented_control(key="tag_filter")
+        options = list(tag_filter.options)
+        tags, grid = [], []
+        for i in range(runs):
+            # One tag, two tags, then cleared, cycling through the catalogue
+            chosen = [] if i % 3 == 2 else options[i % len(options):i % len(options) + 1 + i % 3]
+            at.segmented_control(key="tag_filter").set_value(chosen)
+            tags.append(run_app(at))
+            grid.append(section_ms(at, "Projects grid"))
+        results += [
+            stats("page.static.project_search", search),
+            stats("page.static.tag_filter", tags),
+            stats("page.static.section.projects_grid", grid),
+        ]
+    return results
+
+
+def _search_box(at):
+    return next(w for w in at.text_input if w.label == "Search")
+
+
+def bench_memory(sessions):
+    import gc
+    import tracemalloc
+
+    # Fill the process-wide caches (fragments, assets, content) with one session first
+    run_app(new_app())
+    wait_for_warmup()
+    gc.collect()
+    tracemalloc.start()
+    base_heap = tracemalloc.get_traced_memory()[0]
+    base_rss = rss_mb()
+    alive = []
+    for _ in range(sessions):
+        at = new_app()
+        run_app(at)
+        run_app(at)
+        alive.append(at)
+    gc.collect()
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return [
+        stats("memory.session_heap", [(heap - base_heap) / sessions / 1024], "KiB", sessions=sessions),
+        stats("memory.session_rss", [(rss_mb() - base_rss) / sessions * 1024], "KiB", sessions=sessions),
+    ]
+
+
+def bench_chatbot(runs):
+    import chatbot
+
+    if not chatbot.available():
+        raise RuntimeError("chatbot dependencies are not installed")
+    chatbot.register_source("projects", _project_documents())
+
+    build_ms, db = timed_ms(lambda: chatbot.build_vector_db(chatbot.load_embeddings()))
+    reload_ms, _ = timed_ms(lambda: chatbot.build_vector_db(chatbot.load_embeddings()))
+    if db is None:
+        raise RuntimeError("no knowledge base sources found")
+    chain = chatbot.get_qa_chain()
+
+    retrieval, answer, stream = [], [], []
+    for i in range(runs):
+        q = QUESTIONS[i % len(QUESTIONS)]
+        retrieval.append(timed_ms(lambda: chain.retriever.invoke(q))[0])
+        answer.append(timed_ms(lambda: chatbot.answer_query(q))[0])
+        stream.append(timed_ms(lambda: list(chatbot.stream_answer(q)))[0])
+    overhead = [a - r for a, r in zip(answer, retrieval)]
+
+    # Through the UI: distinct questions miss the answer cache, repeats hit it
+    chatbot.start_warmup()
+    wait_for_warmup()
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_string(CHAT_SCRIPT, default_timeout=120)
+    run_app(at)
+    ask, cached = [], []
+    for i in range(runs):
+        at.text_input(key="chat_input").input(f"{QUESTIONS[i % len(QUESTIONS)]} (#{i})")
+        ask.append(_click_send(at))
+    for i in range(runs):
+        at.text_input(key="chat_input").input(f"{QUESTIONS[i % len(QUESTIONS)]} (#{i})")
+        cached.append(_click_send(at))
+    return [
+        stats("chatbot.index_build", [build_ms], chunks=len(db.index_to_docstore_id)),
+        stats("chatbot.index_reload", [reload_ms]),
+        stats("chatbot.retrieval", retrieval, search_type=chatbot.SEARCH_TYPE),
+        stats("chatbot.chain_overhead", overhead),
+        stats("chatbot.answer", answer),
+        stats("chatbot.stream_answer", stream),
+        stats("chatbot.ui_ask", ask),
+        stats("chatbot.ui_ask_cached", cached),
+    ]
+
+
+def _click_send(at):
+    send = next(b for b in at.button if b.label == "Send")
+    send.click()
+    return run_app(at)
+
+
+def _project_documents():
+    import ingest
+    from content import ContentStore
+
+    return ingest.project_documents(ContentStore(os.path.join(ROOT, "content"), revalidate_seconds=0).get("projects"))
+
+
+WORKERS = {"page": bench_page, "memory": bench_memory, "chatbot": bench_chatbot}
+
+
+# =========================
+# Driver
+# =========================
+# Scratch chatbot index shared by this run's workers; removed on exit
+_scratch = tempfile.TemporaryDirectory(prefix="portfolio-bench-")
+
+
+def worker_env():
+    env = dict(os.environ)
+    env.update(HF_HUB_OFFLINE="1", TRANSFORMERS_OFFLINE="1", PYTHONHASHSEED="0")
+    env.setdefault("CHATBOT_INDEX_DIR", os.path.join(_scratch.name, "index"))
+    return env
+
+
+def run_worker(group, amount):
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", __file__, "--worker", group, "--runs", str(amount)],
+        cwd=ROOT, env=worker_env(), capture_output=True, text=True,
+    )
+    line = next((l for l in reversed(proc.stdout.splitlines()) if l.startswith("RESULT ")), None)
+    if proc.returncode != 0 or line is None:
+        err = (proc.stderr.strip().splitlines() or ["failed"])[-1]
+        return [{"name": f"{group}.error", "error": err}]
+    return json.loads(line[len("RESULT "):])
+
+
+def metadata():
+    import streamlit
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], cwd=ROOT, capture_output=True, text=True).stdout.strip())
+    except OSError:
+        commit, dirty = None, None
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def compare(baseline, results, threshold):
+    """Print p50 changes against ``baseline``; returns the names that regressed past ``threshold``."""
+    old = {r["name"]: r for r in baseline["results"] if "p50" in r}
+    regressed = []
+    print(f"\n{'metric':<36} {'before':>10} {'after':>10} {'change':>8}")
+    for r in results:
+        before = old.get(r["name"])
+        if "p50" not in r or before is None or before["unit"] != r["unit"]:
+            continue
+        change = (r["p50"] - before["p50"]) / before["p50"] if before["p50"] else 0.0
+        flag = ""
+        if change > threshold:
+            regressed.append(r["name"])
+            flag = "  REGRESSED"
+        print(f"{r['name']:<36} {before['p50']:>10.2f} {r['p50']:>10.2f} {change:>+7.0%}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless benchmarks for the portfolio app and chatbot.")
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=list(GROUPS))
+    parser.add_argument("--runs", type=int, default=10, help="iterations per metric (fresh interpreters for cold)")
+    parser.add_argument("--sessions", type=int, default=5, help="simulated sessions for the memory group")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="earlier --json output to diff against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="p50 slowdown that counts as a regression")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        sys.path.insert(0, ROOT)
+        sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+        import chatbot
+
+        if chatbot.available():
+            # The page starts the assistant's warm-up too; keep it on the stubs
+            import stubs
+
+            stubs.install()
+        print("RESULT " + json.dumps(WORKERS[args.worker](args.runs)))
+        return
+
+    results = []
+    for group in args.only:
+        if group == "cold":
+            try:
+                results += bench_cold(max(1, args.runs // 3))
+            except RuntimeError as e:
+                results.append({"name": "cold.error", "error": str(e).splitlines()[-1]})
+        else:
+            results += run_worker(group, args.sessions if group == "memory" else args.runs)
+
+    print(f"{'metric':<36} {'unit':>4} {'n':>4} {'p50':>10} {'p95':>10} {'max':>10}")
+    for r in results:
+        if "error" in r:
+            print(f"{r['name']:<36} error: {r['error']}")
+        else:
+            print(f"{r['name']:<36} {r['unit']:>4} {r['n']:>4} {r['p50']:>10.2f} {r['p95']:>10.2f} {r['max']:>10.2f}")
+
+    report = {"schema": SCHEMA, "meta": metadata(), "results": results}
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=1, sort_keys=True)
+
+    failed = any("error" in r for r in results)
+    if args.compare:
+        with open(args.compare) as f:
+            regressed = compare(json.load(f), results, args.threshold)
+        if regressed:
+            print(f"\n{len(regressed)} metric(s) slower than {args.threshold:.0%}: {', '.join(regressed)}")
+            failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
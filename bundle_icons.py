@@ -0,0 +1,143 @@
+# bundle_icons.py
+# -------------------------------------------------------
+# Build step: vendors the skill icons listed in
+# content/skills.json and packs them into one stylesheet, so
+# the skills grid makes no third-party requests.
+#
+#   python bundle_icons.py --fetch   # download missing icons into icons/
+#   python bundle_icons.py           # rebuild the stylesheet from icons/
+#
+# Originals are stored once per content hash (icons/<sha>.<ext>;
+# two URLs serving the same image share a file). Each unique
+# icon becomes one CSS class whose background is a data URI:
+# SVGs as-is, rasters downscaled to 2x the display size.
+# icons/manifest.json maps every icon URL to its class and
+# is what assets.icon_bundle reads at render time.
+# -------------------------------------------------------
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import urllib.request
+
+from PIL import Image
+
+from assets import ICON_MANIFEST_PATH, ICON_SIZE, ICON_STYLESHEET, ICONS_DIR
+from content import ContentStore
+
+USER_AGENT = "Mozilla/5.0 (portfolio icon bundler)"
+FETCH_TIMEOUT = 20
+_SPACE = re.compile(r">\s+<")
+
+
+def icon_urls():
+    """Every distinct icon URL in content/skills.json, in page order."""
+    urls = []
+    for group in ContentStore(revalidate_seconds=0).get("skills"):
+        for skill in group["skills"]:
+            if skill["icon"].startswith("http") and skill["icon"] not in urls:
+                urls.append(skill["icon"])
+    return urls
+
+
+def is_svg(data):
+    return b"<svg" in data[:2048].lower()
+
+
+def fetch(url):
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    with urllib.request.urlopen(req, timeout=FETCH_TIMEOUT) as resp:
+        return resp.read()
+
+
+def vendor(url, data):
+    """Store ``data`` under its content hash; returns (path, sha256)."""
+    digest = hashlib.sha256(data).hexdigest()
+    if is_svg(data):
+        ext = ".svg"
+    else:
+        with Image.open(io.BytesIO(data)) as im:
+            ext = "." + (im.format or "png").lower()
+    path = os.path.join(ICONS_DIR, digest[:12] + ext).replace(os.sep, "/")
+    if not os.path.exists(path):
+        os.makedirs(ICONS_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+    return path, digest
+
+
+def data_uri(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    if is_svg(data):
+        svg = _SPACE.sub("><", data.decode("utf-8").strip())
+        return "data:image/svg+xml;base64," + base64.b64encode(svg.encode("utf-8")).decode("ascii")
+    with Image.open(io.BytesIO(data)) as im:
+        im = im.convert("RGBA")
+        im.thumbnail((ICON_SIZE * 2, ICON_SIZE * 2), Image.LANCZOS)
+        out = io.BytesIO()
+        im.save(out, "PNG", optimize=True)
+    return "data:image/png;base64," + base64.b64encode(out.getvalue()).decode("ascii")
+
+
+def build_stylesheet(classes):
+    """``classes``: {css class: vendored file}."""
+    rules = [
+        f".skill-icon{{display:inline-block;flex:none;width:{ICON_SIZE}px;height:{ICON_SIZE}px;"
+        "margin-right:10px;background:center/contain no-repeat;}"
+    ]
+    for cls, path in sorted(classes.items()):
+        rules.append(f".{cls}{{background-image:url({data_uri(path)});}}")
+    return "\n".join(rules) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vendor skill icons and bundle them into one stylesheet.")
+    parser.add_argument("--fetch", action="store_true", help="download icons that are not vendored yet")
+    args = parser.parse_args()
+
+    try:
+        with open(ICON_MANIFEST_PATH) as f:
+            old = json.load(f).get("icons", {})
+    except (OSError, ValueError):
+        old = {}
+
+    icons, missing = {}, []
+    for url in icon_urls():
+        entry = old.get(url)
+        if entry and os.path.exists(entry["file"]):
+            icons[url] = entry
+            continue
+        if not args.fetch:
+            missing.append(url)
+            continue
+        try:
+            path, digest = vendor(url, fetch(url))
+        except Exception as e:
+            print(f"FAILED {url}: {type(e).__name__}: {e}")
+            missing.append(url)
+            continue
+        icons[url] = {"file": path, "sha256": digest, "class": f"i-{digest[:10]}"}
+
+    classes = {e["class"]: e["file"] for e in icons.values()}
+    css = build_stylesheet(classes)
+    os.makedirs(os.path.dirname(ICON_STYLESHEET), exist_ok=True)
+    with open(ICON_STYLESHEET, "w") as f:
+        f.write(css)
+    os.makedirs(os.path.dirname(ICON_MANIFEST_PATH), exist_ok=True)
+    with open(ICON_MANIFEST_PATH, "w") as f:
+        json.dump({"version": 1, "stylesheet": ICON_STYLESHEET, "icons": icons}, f, indent=1, sort_keys=True)
+
+    print(f"{len(icons)} icon URLs -> {len(classes)} unique icons, {len(css) / 1024:.1f} KB stylesheet ({ICON_STYLESHEET})")
+    for url in missing:
+        print(f"not bundled (remote fallback): {url}")
+    if missing and not args.fetch:
+        print("run with --fetch to download them")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+# cards.py
+# -------------------------------------------------------
+# HTML for the page's static blocks: skill, project and
+# timeline cards plus the fixed hero / about / socials /
+# resume / footer markup. Shared by app.py (which renders
+# them through fragment_cache) and export_static.py (which
+# writes them into the pre-rendered page), so both show
+# the same sections.
+# -------------------------------------------------------
+
+import re
+
+from assets import COVER_WIDTH, LOGO_SIZE, icon_bundle, picture_html
+
+# Rotated by the hero's typing effect
+TYPING_ROLES = ["Data Scientist", "ML Engineer", "Computer Vision", "NLP & RAG", "Agentic Ai", "Analytics & Dashboards"]
+
+# =========================
+# Hero / About
+# =========================
+BADGE_HTML = '<span class="badge">👨‍🔬 Data Science • AI Enthusiast</span>'
+
+TITLE_HTML = '<div class="big-title">Hi 👋, I\'m <span class="gradient-text">Ansh Kedia</span></div>'
+
+INTRO_HTML = """
+        <div class="subhead hero-intro">
+        I build intelligent, data-driven systems combining <b>Machine Learning</b>, <b>Computer Vision</b>, and <b>Natural Language Processing</b>.
+        My goal is to turn raw data into <b>insights, automation, and real-world impact</b>.
+        </div>
+        """
+
+QUICK_PEEK_HTML = """
+        <div class="card card-hover">
+          <h3>Quick Peek</h3>
+          <p class="muted">
+          Final-year Data Science student passionate about building intelligent systems that bridge the gap between data and decision-making.
+          Experienced in designing and deploying AI solutions with a focus on performance and interpretability.
+          </p>
+          <div class="tags">
+            <span class="tag">Python</span>
+            <span class="tag">TensorFlow</span>
+            <span class="tag">scikit-learn</span>
+            <span class="tag">OpenCV</span>
+            <span class="tag">Transformers</span>
+            <span class="tag">SQL</span>
+            <span class="tag">Plotly</span>
+            <span class="tag">Streamlit</span>
+          </div>
+        </div>
+        """
+
+CONNECT_HTML = """
+        <div class="card card-hover">
+          <h3>Connect Instantly</h3>
+          <div class="contact-lines">
+            <strong>Email:</strong> anshkedia.04@gmail.com<br>
+            <strong>LinkedIn:</strong> <a href="https://www.linkedin.com/in/ansh-kedia-249843266/" target="_blank">linkedin.com/in/anshkedia</a><br>
+            <strong>GitHub:</strong> <a href="https://github.com/anshkedia-04" target="_blank">github.com/anshkedia</a><br>
+          </div>
+          <div class="card-actions">
+            <a class="btn btn-ghost" href="mailto:anshkedia.04@gmail.com">Email Me</a>
+            <a class="btn btn-primary" href="https://github.com/anshkedia-04" target="_blank">GitHub</a>
+          </div>
+        </div>
+        """
+
+# =========================
+# Resume / Contact / Footer
+# =========================
+RESUME_CARD_HTML = """
+        <div class="resume-card">
+            <h3 class="resume-title">📄 My Resume</h3>
+            <p class="resume-desc">Download a concise, elegant 1-page resume to know more about my journey.</p>
+        </div>
+        """
+
+SOCIALS_HTML = """
+        <div class="card card-hover">
+          <p class="muted">Feel free to connect with me on these platforms:</p>
+          <div class="social-links">
+            <a class="btn btn-primary" href="https://www.linkedin.com/in/ansh-kedia-249843266/" target="_blank">
+                <img src="https://cdn.jsdelivr.net/gh/devicons/devicon/icons/linkedin/linkedin-original.svg" alt="LinkedIn" width="20" height="20">
+                LinkedIn
+            </a>
+            <a class="btn btn-ghost" href="https://github.com/anshkedia-04" target="_blank">
+                <img src="https://cdn.jsdelivr.net/gh/devicons/devicon/icons/github/github-original.svg" alt="GitHub" width="20" height="20">
+                GitHub
+            </a>
+            <a class="btn btn-ghost" href="mailto:anshkedia.04@gmail.com">
+                <span class="social-emoji">✉️</span> Email Directly
+            </a>
+          </div>
+        </div>
+        """
+
+
+def resume_link_html(url):
+    return f'<a class="resume-download" href="{url}" download="Resume.pdf">⬇️ Download Resume</a>'
+
+
+def footer_html(year):
+    return f"""
+    <div class="footer">
+      © {year} Ansh Kedia • Built with Streamlit & ❤️
+    </div>
+    """
+
+
+# =========================
+# Cards
+# =========================
+# URLs the browser would fetch from another host (images, stylesheets, scripts, preloads)
+_EXTERNAL_SRC = re.compile(r'<(?:img|source|link|script)\b[^>]*?\b(?:src|srcset|imagesrcset|href)="(https?://[^"\s]+)')
+
+
+def external_srcs(markup):
+    """Third-party URLs ``markup`` loads; links the visitor clicks are not counted."""
+    return _EXTERNAL_SRC.findall(markup)
+
+
+def unbundled_icons(groups):
+    """Skill icon URLs missing from the icon bundle (shown as placeholders)."""
+    return [s["icon"] for g in groups for s in g["skills"] if s["icon"].startswith("http") and not icon_bundle.icon_class(s["icon"])]
+
+
+def skill_card_html(skill):
+    name, icon_url = skill["name"], skill["icon"]
+    # Bundled icon (bundle_icons.py) if available, else a placeholder with the first
+    # letter: the skills grid never makes a third-party request
+    icon_class = icon_bundle.icon_class(icon_url)
+    if icon_class:
+        icon_html = f'<span class="skill-icon {icon_class}" role="img" aria-label="{name.strip()}"></span>'
+    else:
+        icon_html = f'<div class="skill-placeholder">{name[1][0]}</div>'
+    return f"""
+                <div class="card card-hover skill-card">
+                    {icon_html}
+                    <span class="skill-name">{name}</span>
+                </div>
+                """
+
+
+def project_card_html(p, img_attrs, mode=None):
+    tags = "".join(f'<span class="tag project-tag">{t}</span>' for t in p["tags"])
+    demo = f"<a href='{p['demo']}' target='_blank' class='btn btn-ghost project-demo'>Demo</a>" if p["demo"] else ""
+    return f"""
+                    <div class="card card-hover project-card">
+                      {picture_html(p['img'], COVER_WIDTH, f'{img_attrs} decoding="async" class="project-cover"', mode)}
+                      <h3 class="project-title">{p['title']}</h3>
+                      <p class="project-desc">{p['desc']}</p>
+                      <div class="tags project-tags">{tags}</div>
+                      <div class="project-actions">
+                        <a href="{p['repo']}" target="_blank" class="btn btn-primary project-repo">Repo</a>
+                        {demo}
+                      </div>
+                    </div>
+                    """
+
+
+def timeline_item_html(it, mode=None):
+    """HTML for a single timeline item."""
+
+    # 1. Logo: optimized variants (see optimize_images.py) as a data URI or
+    #    content-hashed static URLs depending on the asset mode
+    logo_html = picture_html(it["logo"], LOGO_SIZE, 'class="timeline-logo"', mode)
+    if not logo_html:
+        # Placeholder for missing logo
+        logo_html = '<div class="timeline-logo-na">N/A</div>'
+
+    # 2. The item HTML
+    return f"""
+        <div class="timeline-item card-hover">
+          {logo_html}
+          <div>
+            <div class="timeline-when">{it['when']}</div>
+            <div class="timeline-title">{it['title']}</div>
+            <div class="timeline-where">{it['where']}</div>
+            <div class="timeline-detail">{it['detail']}</div>
+          </div>
+        </div>
+        """
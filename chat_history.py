@@ -0,0 +1,86 @@
+# chat_history.py
+# -------------------------------------------------------
+# Bounded per-session chat history for the chatbot. Turns
+# live in a ring buffer capped at ``max_turns``; turns that
+# fall off the end are folded into one compact summary entry
+# (the questions asked, truncated) instead of being kept
+# verbatim. Rendering only ever touches a recent window.
+# -------------------------------------------------------
+
+import html
+import re
+from collections import deque
+
+DEFAULT_MAX_TURNS = 50
+DEFAULT_WINDOW = 10
+SUMMARY_TOPIC_CHARS = 60
+SUMMARY_MAX_TOPICS = 12
+
+_SPACE = re.compile(r"\s+")
+
+
+def _topic(question):
+    text = _SPACE.sub(" ", question).strip()
+    if len(text) > SUMMARY_TOPIC_CHARS:
+        text = text[:SUMMARY_TOPIC_CHARS - 1].rstrip() + "…"
+    return text
+
+
+class ChatHistory:
+    """Ring buffer of (question, answer) turns plus a summary of evicted ones."""
+
+    def __init__(self, max_turns=DEFAULT_MAX_TURNS):
+        self.max_turns = max(1, max_turns)
+        self.turns = deque()
+        self.compacted = 0
+        self.topics = deque(maxlen=SUMMARY_MAX_TOPICS)
+
+    def __len__(self):
+        return len(self.turns)
+
+    def append(self, question, answer):
+        self.turns.append((question, answer))
+        while len(self.turns) > self.max_turns:
+            old_question, _ = self.turns.popleft()
+            self.compacted += 1
+            self.topics.append(_topic(old_question))
+
+    @property
+    def summary(self):
+        """One line describing the compacted turns, or None if nothing was compacted."""
+        if not self.compacted:
+            return None
+        shown = len(self.topics)
+        more = f" and {self.compacted - shown} more" if self.compacted > shown else ""
+        return f"{self.compacted} earlier question(s): " + "; ".join(self.topics) + more
+
+    def window(self, size):
+        """The most recent ``size`` turns, oldest first."""
+        if size >= len(self.turns):
+            return list(self.turns)
+        return list(self.turns)[-size:]
+
+    def messages(self):
+        """(speaker, text) pairs for every retained turn, as the old list held them."""
+        out = []
+        for question, answer in self.turns:
+            out.append(("You", question))
+            out.append(("Bot", answer))
+        return out
+
+    def clear(self):
+        self.turns.clear()
+        self.topics.clear()
+        self.compacted = 0
+
+
+def render_html(turns, summary=None):
+    """All of ``turns`` as one HTML block, so a rerun emits a single element."""
+    parts = []
+    if summary:
+        parts.append(f"<div class='chat-summary'>🗂️ {html.escape(summary)}</div>")
+    # Rendered with unsafe_allow_html, and cached answers are shared across sessions
+    for question, answer in turns:
+        parts.append(f"<div class='chat-you'><b>You:</b> {html.escape(question)}</div>")
+        parts.append(f"<div class='chat-bot'><b>Bot:</b> {html.escape(answer)}</div>")
+    return "\n".join(parts)
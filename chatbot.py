@@ -1,107 +1,534 @@
 # chatbot.py
+# langchain / transformers / faiss are imported inside the functions that use
+# them (on the warm-up thread or the first question), so importing this module
+# costs the page nothing; available() says whether they are installed at all.
+import functools
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import pickle
+import shutil
+import threading
+import time
+
 import streamlit as st
-from langchain_community.document_loaders import PyPDFLoader, TextLoader
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain.vectorstores import FAISS
-from langchain_community.llms import HuggingFacePipeline
-from langchain.chains import RetrievalQA
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM, pipeline
+from answer_cache import AnswerCache
+from chat_history import ChatHistory, render_html
+import ingest
+from llm_backends import DEFAULT_BACKEND, BatchScheduler, BatchedPipeline, build_pipeline
+
+# Packages the assistant needs; checked without importing them
+REQUIRED_PACKAGES = ("faiss", "langchain", "langchain_community", "transformers", "sentence_transformers")
 
 # ===============================
-# Load Documents (FAQ + Resume)
+# Settings
 # ===============================
-def load_documents():
-    docs = []
+# Knowledge base: these files plus every PDF / txt / md file under KNOWLEDGE_DIR,
+# plus in-memory sources registered by the app (e.g. the PROJECTS cards)
+SOURCES = ["faq.txt", "Resume.pdf"]
+KNOWLEDGE_DIR = os.environ.get("CHATBOT_KNOWLEDGE_DIR", "knowledge")
+INGEST_WORKERS = int(os.environ.get("CHATBOT_INGEST_WORKERS", 0)) or None
+EMBED_BATCH_SIZE = int(os.environ.get("CHATBOT_EMBED_BATCH_SIZE", 64))
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+CHUNK_SIZE = 500
+CHUNK_OVERLAP = 100
+LLM_MODEL = "google/flan-t5-base"
+GENERATION_MAX_LENGTH = 256
+LLM_BACKEND = DEFAULT_BACKEND
+# Share one model across sessions by batching concurrent prompts
+BATCHING = os.environ.get("CHATBOT_BATCHING", "1") != "0"
+BATCH_MAX_SIZE = int(os.environ.get("CHATBOT_BATCH_MAX_SIZE", 8))
+BATCH_MAX_WAIT = float(os.environ.get("CHATBOT_BATCH_MAX_WAIT", 0.02))
+# Show answers token by token as they are generated
+STREAMING = os.environ.get("CHATBOT_STREAMING", "1") != "0"
+RETRIEVER_K = 3
+# hybrid (BM25 + FAISS, fused) | keyword (BM25 only) | similarity / mmr (FAISS only)
+SEARCH_TYPE = os.environ.get("CHATBOT_SEARCH_TYPE", "hybrid")
+HYBRID_FUSION = os.environ.get("CHATBOT_HYBRID_FUSION", "rrf")   # rrf | weighted
+HYBRID_ALPHA = float(os.environ.get("CHATBOT_HYBRID_ALPHA", 0.5))
+# Share of the query's IDF weight the best BM25 hit must match to skip the embedding pass
+KEYWORD_FAST_PATH_CONFIDENCE = float(os.environ.get("CHATBOT_KEYWORD_FAST_PATH", 0.8))
+ANSWER_CACHE_THRESHOLD = 0.92
+ANSWER_CACHE_TTL = 24 * 60 * 60
+ANSWER_CACHE_SIZE = 256
+# Turns kept per session (older ones are compacted into a summary) and turns rendered per rerun
+HISTORY_MAX_TURNS = int(os.environ.get("CHATBOT_HISTORY_MAX_TURNS", 50))
+HISTORY_WINDOW = int(os.environ.get("CHATBOT_HISTORY_WINDOW", 10))
 
-    # Load FAQ (text file)
-    try:
-        faq_loader = TextLoader("faq.txt")
-        docs += faq_loader.load()
-    except:
-        pass
+logger = logging.getLogger(__name__)
 
-    # Load Resume (PDF)
-    try:
-        pdf_loader = PyPDFLoader("resume.pdf")
-        docs += pdf_loader.load()
-    except:
-        pass
+# Saved FAISS index + chunk metadata; survives restarts (e.g. the 3-hourly redeploy)
+INDEX_DIR = os.environ.get("CHATBOT_INDEX_DIR", ".cache/faiss_index")
+INDEX_MANIFEST = "manifest.json"
 
-    return docs
+@functools.lru_cache(maxsize=None)
+def available():
+    """True if the assistant's heavy dependencies are installed (nothing is imported)."""
+    return all(importlib.util.find_spec(name) is not None for name in REQUIRED_PACKAGES)
+
+# ===============================
+# Load Documents (FAQ + Resume + knowledge/ + registered)
+# ===============================
+REGISTERED = "registered:"
+_registered_sources = {}   # name -> list[Document], or a callable returning them
+_last_ingest_report = []
+
+def register_source(name, documents):
+    """Add in-memory documents (e.g. project descriptions) to the knowledge base.
+
+    ``documents`` may be a zero-argument callable; it is called on first use
+    (the warm-up thread or a question), so registering costs the page nothing.
+    Re-registering changed documents drops the cached index and chain; the
+    next build re-embeds only this source and keeps the loaded models.
+    """
+    documents = documents if callable(documents) else list(documents)
+    previous = _registered_sources.get(name)
+    _registered_sources[name] = documents
+    if previous is None:
+        return
+    # A callable can't be compared without building it, so count it as a change
+    if callable(previous) or callable(documents) or documents_sha256(previous) != documents_sha256(documents):
+        logger.info("Registered source %s changed; refreshing the index", name)
+        create_vector_db.clear()
+        create_lexical_index.clear()
+        get_qa_chain.clear()
+
+def registered_documents(name):
+    """The documents registered as ``name``, building them on first use."""
+    documents = _registered_sources[name]
+    if callable(documents):
+        documents = _registered_sources[name] = list(documents())
+    return documents
+
+def source_files():
+    return ingest.discover(SOURCES, KNOWLEDGE_DIR)
+
+def ingest_report():
+    """Per-source results of the last (re)build: chunks, parse/embed seconds, error."""
+    return list(_last_ingest_report)
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+def documents_sha256(documents):
+    h = hashlib.sha256()
+    for d in documents:
+        h.update(json.dumps([d.page_content, d.metadata], sort_keys=True, default=str).encode())
+    return h.hexdigest()
+
+def index_settings_key():
+    """Anything that changes the chunks or vectors invalidates the whole index."""
+    settings = {
+        "embedding_model": EMBEDDING_MODEL,
+        "splitter": "RecursiveCharacterTextSplitter",
+        "chunk_size": CHUNK_SIZE,
+        "chunk_overlap": CHUNK_OVERLAP,
+    }
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
 
 # ===============================
 # Create Vector DB
 # ===============================
 @st.cache_resource
-def create_vector_db():
-    docs = load_documents()
-    if not docs:
+def load_embeddings():
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+
+    return HuggingFaceEmbeddings(model_name=EMBEDDING_MODEL)
+
+def split_documents(documents, digest):
+    """Chunk one source's documents; chunk ids are derived from its content hash."""
+    from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+    splitter = RecursiveCharacterTextSplitter(chunk_size=CHUNK_SIZE, chunk_overlap=CHUNK_OVERLAP)
+    chunks = splitter.split_documents(documents)
+    ids = [f"{digest[:16]}-{i}" for i in range(len(chunks))]
+    return chunks, ids
+
+def load_sources(sources):
+    """Documents for each source id, parsing files in a process pool.
+
+    Returns {source: (documents, parse seconds, error)}.
+    """
+    files = [s for s in sources if not s.startswith(REGISTERED)]
+    loaded = {path: (docs, secs, err) for path, docs, secs, err in ingest.parse_files(files, INGEST_WORKERS)}
+    for source in sources:
+        if source.startswith(REGISTERED):
+            loaded[source] = (registered_documents(source[len(REGISTERED):]), 0.0, None)
+    return loaded
+
+def read_manifest(index_dir=INDEX_DIR):
+    try:
+        with open(os.path.join(index_dir, INDEX_MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
         return None
 
-    # Split into chunks
-    splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=100)
-    docs_split = splitter.split_documents(docs)
+def load_index(embeddings, index_dir=INDEX_DIR, mmap=True):
+    """Open a saved index; with ``mmap`` the vectors stay on disk (read-only)."""
+    import faiss
+    from langchain.vectorstores import FAISS
+
+    flags = faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY if mmap else 0
+    index = faiss.read_index(os.path.join(index_dir, "index.faiss"), flags)
+    with open(os.path.join(index_dir, "index.pkl"), "rb") as f:
+        docstore, index_to_docstore_id = pickle.load(f)
+    return FAISS(embeddings, index, docstore, index_to_docstore_id)
+
+def build_lexical_index(db):
+    """BM25 inverted index over the same chunks (and ids) as the FAISS store."""
+    from retrieval import BM25Index
+
+    ids = db.index_to_docstore_id.values()
+    return BM25Index.from_texts((i, db.docstore.search(i).page_content) for i in ids)
+
+def load_lexical_index(db, index_dir=INDEX_DIR):
+    try:
+        with open(os.path.join(index_dir, "bm25.pkl"), "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Index saved before the lexical index existed
+        return build_lexical_index(db)
+
+def save_index(db, manifest, index_dir=INDEX_DIR):
+    # Write next to the live copy, then swap files in; the manifest goes last.
+    tmp_dir = f"{index_dir}.tmp-{os.getpid()}"
+    db.save_local(tmp_dir)
+    with open(os.path.join(tmp_dir, "bm25.pkl"), "wb") as f:
+        pickle.dump(build_lexical_index(db), f)
+    with open(os.path.join(tmp_dir, INDEX_MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.makedirs(index_dir, exist_ok=True)
+    for name in ("index.faiss", "index.pkl", "bm25.pkl", INDEX_MANIFEST):
+        os.replace(os.path.join(tmp_dir, name), os.path.join(index_dir, name))
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+def build_vector_db(embeddings, index_dir=INDEX_DIR):
+    """Load the saved index, re-embedding only sources whose content changed."""
+    from langchain.vectorstores import FAISS
+
+    settings = index_settings_key()
+    current = {path: file_sha256(path) for path in source_files()}
+    for name in list(_registered_sources):
+        current[REGISTERED + name] = documents_sha256(registered_documents(name))
+
+    manifest = read_manifest(index_dir)
+    if not manifest or manifest.get("settings") != settings:
+        manifest = {"settings": settings, "sources": {}}
+    saved = manifest["sources"]
 
-    # Embeddings
-    embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+    stale = [p for p in saved if current.get(p) != saved[p]["sha256"]]
+    fresh = [p for p in current if p not in saved or saved[p]["sha256"] != current[p]]
 
-    # Store in FAISS
-    db = FAISS.from_documents(docs_split, embeddings)
+    db = None
+    if saved:
+        try:
+            if not stale and not fresh:
+                return load_index(embeddings, index_dir, mmap=True)
+            db = load_index(embeddings, index_dir, mmap=False)
+        except Exception:
+            # Missing or unreadable files: start over from the sources.
+            saved.clear()
+            stale, fresh = [], list(current)
+    elif not fresh:
+        return None
+
+    for path in stale:
+        if db is not None and saved[path]["ids"]:
+            db.delete(saved[path]["ids"])
+        del saved[path]
+
+    report = []
+    for path, (documents, parse_s, error) in load_sources(fresh).items():
+        entry = {"source": path, "chunks": 0, "parse_s": parse_s, "embed_s": 0.0, "error": error}
+        report.append(entry)
+        # Recorded even when empty or unparseable, so an unchanged file is not retried every start
+        saved[path] = {"sha256": current[path], "ids": [], "error": error}
+        if error:
+            continue
+        chunks, ids = split_documents(documents, current[path])
+        if not chunks:
+            continue
+        t0 = time.perf_counter()
+        try:
+            texts = [c.page_content for c in chunks]
+            vectors = ingest.embed_in_batches(embeddings, texts, EMBED_BATCH_SIZE)
+        except Exception as e:
+            entry["error"] = f"embedding failed: {e}"
+            del saved[path]
+            continue
+        pairs = list(zip(texts, vectors))
+        metadatas = [c.metadata for c in chunks]
+        if db is None:
+            db = FAISS.from_embeddings(pairs, embeddings, metadatas=metadatas, ids=ids)
+        else:
+            db.add_embeddings(pairs, metadatas=metadatas, ids=ids)
+        entry.update(chunks=len(chunks), embed_s=time.perf_counter() - t0)
+        saved[path]["ids"] = ids
+
+    _last_ingest_report[:] = report
+    if report:
+        logger.info("Knowledge base ingest:\n%s", ingest.format_report(report))
+
+    if db is None or not db.index_to_docstore_id:
+        shutil.rmtree(index_dir, ignore_errors=True)
+        return None
+    save_index(db, manifest, index_dir)
     return db
 
+def knowledge_base_version(index_dir=INDEX_DIR):
+    """Changes whenever the saved index is rebuilt from different sources/settings."""
+    manifest = read_manifest(index_dir)
+    if not manifest:
+        return None
+    return hashlib.sha256(json.dumps(manifest, sort_keys=True).encode()).hexdigest()
+
+@st.cache_resource
+def create_vector_db():
+    return build_vector_db(load_embeddings())
+
+@st.cache_resource
+def create_lexical_index():
+    db = create_vector_db()
+    return None if db is None else load_lexical_index(db)
+
 # ===============================
 # Load LLM
 # ===============================
 @st.cache_resource
-def load_llm():
-    model_name = "google/flan-t5-base"
-    tokenizer = AutoTokenizer.from_pretrained(model_name)
-    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+def load_llm(model_name=LLM_MODEL, backend=LLM_BACKEND):
+    # backend: torch | int8 | onnx (see llm_backends.py)
+    pipe = build_pipeline(model_name, backend, max_length=GENERATION_MAX_LENGTH)
+    if BATCHING:
+        scheduler = BatchScheduler(pipe, max_batch_size=BATCH_MAX_SIZE, max_wait=BATCH_MAX_WAIT, max_length=GENERATION_MAX_LENGTH)
+        pipe = BatchedPipeline(scheduler)
+    from langchain_community.llms import HuggingFacePipeline
 
-    pipe = pipeline("text2text-generation", model=model, tokenizer=tokenizer, max_length=256)
     return HuggingFacePipeline(pipeline=pipe)
 
 # ===============================
-# Chatbot UI
+# QA Chain
 # ===============================
-def chatbot():
-    st.markdown("<h3 style='text-align: center;'>🤖 Ask Me Anything</h3>", unsafe_allow_html=True)
+@st.cache_resource
+def get_qa_chain(k=RETRIEVER_K, search_type=SEARCH_TYPE, llm_id=(LLM_MODEL, LLM_BACKEND)):
+    """One chain per (retriever config, LLM) per process; None without a knowledge base."""
+    from langchain.chains import RetrievalQA
+    from retrieval import HybridRetriever
 
-    # Initialize retriever + QA chain
     db = create_vector_db()
-    llm = load_llm()
+    if db is None:
+        return None
+    if search_type in ("hybrid", "keyword"):
+        retriever = HybridRetriever(
+            vectorstore=db,
+            lexical=create_lexical_index(),
+            k=k,
+            mode=search_type,
+            fusion=HYBRID_FUSION,
+            alpha=HYBRID_ALPHA,
+            fast_path_confidence=KEYWORD_FAST_PATH_CONFIDENCE,
+        )
+    else:
+        retriever = db.as_retriever(search_type=search_type, search_kwargs={"k": k})
+    return RetrievalQA.from_chain_type(llm=load_llm(*llm_id), retriever=retriever)
+
+# The instance get_answer_cache built, so its stats can be read without loading the embedder
+_answer_cache = None
+
+@st.cache_resource
+def get_answer_cache():
+    global _answer_cache
+    # Shares the MiniLM embedder with the vector DB
+    _answer_cache = AnswerCache(
+        load_embeddings().embed_query,
+        threshold=ANSWER_CACHE_THRESHOLD,
+        max_entries=ANSWER_CACHE_SIZE,
+        ttl=ANSWER_CACHE_TTL,
+    )
+    return _answer_cache
+
+def answer_cache_stats():
+    """Exact/semantic hit counters of the answer cache, or None before the first question."""
+    return _answer_cache.stats() if _answer_cache is not None else None
+
+def answer_query(query):
+    qa_chain = get_qa_chain()
+    if qa_chain is None:
+        raise LookupError("Knowledge base not loaded")
+    return qa_chain.invoke(query)["result"]
+
+def stream_answer(query):
+    """Same retrieval and "stuff" prompt as the RetrievalQA chain, but yields
+    the answer token by token (HuggingFacePipeline streams via TextIteratorStreamer)."""
+    from langchain_core.prompts import format_document
+
+    qa_chain = get_qa_chain()
+    if qa_chain is None:
+        raise LookupError("Knowledge base not loaded")
+    docs = qa_chain.retriever.invoke(query)
+    stuff = qa_chain.combine_documents_chain
+    context = stuff.document_separator.join(format_document(d, stuff.document_prompt) for d in docs)
+    prompt = stuff.llm_chain.prompt.format(**{stuff.document_variable_name: context, "question": query})
+    llm = stuff.llm_chain.llm
+    scheduler = getattr(getattr(llm, "pipeline", None), "scheduler", None)
+    if scheduler is not None:
+        yield from scheduler.stream(prompt)
+    else:
+        yield from llm.stream(prompt, pipeline_kwargs={"max_length": GENERATION_MAX_LENGTH})
+
+class StreamTimer:
+    """Records time-to-first-token and total latency of a token stream."""
+
+    def __init__(self, start=None):
+        self.start = start if start is not None else time.perf_counter()
+        self.first_token = None
+        self.total = None
+
+    def wrap(self, chunks):
+        for chunk in chunks:
+            if self.first_token is None:
+                self.first_token = time.perf_counter() - self.start
+            yield chunk
+        self.total = time.perf_counter() - self.start
 
-    if db:
-        retriever = db.as_retriever(search_kwargs={"k": 3})
-        qa_chain = RetrievalQA.from_chain_type(llm=llm, retriever=retriever)
+# ===============================
+# Background Warm-up
+# ===============================
+WARMUP_STAGES = [
+    ("embeddings", lambda: load_embeddings()),
+    ("vector_db", lambda: create_vector_db()),
+    ("llm", lambda: load_llm(LLM_MODEL, LLM_BACKEND)),
+    ("qa_chain", lambda: get_qa_chain()),
+]
+
+_warmup = {"state": "idle", "stage": None, "timings": {}, "error": None}
+_warmup_lock = threading.Lock()
+
+def _run_warmup():
+    start = time.perf_counter()
+    for name, load in WARMUP_STAGES:
+        _warmup["stage"] = name
+        t0 = time.perf_counter()
+        try:
+            load()
+        except Exception as e:
+            _warmup.update(state="failed", error=f"{name}: {e}")
+            logger.exception("Chatbot warm-up failed at %s", name)
+            return
+        _warmup["timings"][name] = time.perf_counter() - t0
+        logger.info("Chatbot warm-up: %s loaded in %.2fs", name, _warmup["timings"][name])
+    _warmup.update(state="ready", stage=None)
+    logger.info("Chatbot warm-up finished in %.2fs", time.perf_counter() - start)
+
+def start_warmup():
+    """Load the embedder, index, LLM and chain in a background thread, once per process.
+
+    app.py calls this from its cached start_assistant initializer, on the first
+    script run after boot, not on every rerun.
+    """
+    with _warmup_lock:
+        if _warmup["state"] == "idle":
+            _warmup["state"] = "running"
+            threading.Thread(target=_run_warmup, name="chatbot-warmup", daemon=True).start()
+
+def retry_warmup():
+    """After a failed warm-up, load the index and chain in the caller; ready again on success."""
+    if _warmup["state"] != "failed":
+        return
+    create_vector_db()
+    get_qa_chain()
+    with _warmup_lock:
+        _warmup.update(state="ready", stage=None, error=None)
+    logger.info("Chatbot warm-up recovered on retry")
+
+def warmup_status():
+    return {**_warmup, "timings": dict(_warmup["timings"])}
+
+@st.fragment(run_every=1.0)
+def _warmup_poller():
+    status = warmup_status()
+    if status["state"] == "running":
+        done = ", ".join(f"{k} {v:.1f}s" for k, v in status["timings"].items())
+        st.info(f"🔥 Assistant warming up… loading {status['stage']}" + (f" (done: {done})" if done else ""))
     else:
-        qa_chain = None
+        # Ready (or failed): rerun once so the input is enabled / the error shown
+        st.rerun()
+
+def _load_earlier():
+    st.session_state.chat_window += HISTORY_WINDOW
+
+
+# ===============================
+# Chatbot UI
+# ===============================
+def chatbot():
+    st.markdown("<h3 class='chat-heading'>🤖 Ask Me Anything</h3>", unsafe_allow_html=True)
 
     if "chat_history" not in st.session_state:
-        st.session_state.chat_history = []
+        st.session_state.chat_history = ChatHistory(HISTORY_MAX_TURNS)
+    if "chat_window" not in st.session_state:
+        st.session_state.chat_window = HISTORY_WINDOW
+    history = st.session_state.chat_history
+
+    status = warmup_status()
+    warming = status["state"] == "running"
+    if warming:
+        _warmup_poller()
+    elif status["state"] == "failed":
+        st.warning(f"⚠️ Assistant failed to load ({status['error']}); it will retry on your first question.")
 
     # User input
     query = st.text_input("💬 Your Question:", key="chat_input")
 
-    if st.button("Send"):
+    if st.button("Send", disabled=warming):
         if query:
-            if qa_chain:
-                try:
-                    response = qa_chain.invoke(query)
-                    answer = response["result"]
-                except Exception as e:
-                    answer = f"⚠️ Error generating response: {e}"
-            else:
+            # Chain is built (or fetched from cache) only once a question is submitted;
+            # repeated / near-duplicate questions are answered from the answer cache
+            start = time.perf_counter()
+            timer = None
+            live = st.empty()
+
+            def generate(q):
+                nonlocal timer
+                if not STREAMING:
+                    return answer_query(q)
+                timer = StreamTimer(start)
+                with live.container():
+                    return st.write_stream(timer.wrap(stream_answer(q)))
+
+            try:
+                # Builds/refreshes the saved index first so the version below is current
+                create_vector_db()
+                retry_warmup()
+                answer = get_answer_cache().get_or_compute(query, generate, version=knowledge_base_version())
+            except LookupError:
                 answer = "⚠️ Knowledge base not loaded. Please upload FAQ/Resume."
+            except Exception as e:
+                answer = f"⚠️ Error generating response: {e}"
+            # The finished answer is shown with the rest of the history below
+            live.empty()
+            st.session_state.last_latency = {
+                "first_token": timer.first_token if timer else None,
+                "total": time.perf_counter() - start,
+            }
 
             # Save conversation
-            st.session_state.chat_history.append(("You", query))
-            st.session_state.chat_history.append(("Bot", answer))
+            history.append(query, answer)
 
-    # Display conversation
-    for speaker, text in st.session_state.chat_history:
-        if speaker == "You":
-            st.markdown(f"<div style='text-align:right;'><b>{speaker}:</b> {text}</div>", unsafe_allow_html=True)
-        else:
-            st.markdown(f"<div style='text-align:left; color:#34D399;'><b>{speaker}:</b> {text}</div>", unsafe_allow_html=True)
+    # Display conversation: only the latest window, as one element
+    hidden = len(history) - st.session_state.chat_window
+    if hidden > 0:
+        st.button(f"⬆️ Load earlier ({hidden})", key="chat_load_earlier", on_click=_load_earlier)
+    summary = history.summary if hidden <= 0 else None
+    if summary or len(history):
+        st.markdown(render_html(history.window(st.session_state.chat_window), summary), unsafe_allow_html=True)
+
+    latency = st.session_state.get("last_latency")
+    if latency:
+        ttft = f"{latency['first_token']:.2f}s" if latency["first_token"] is not None else "n/a"
+        st.caption(f"⏱️ Last answer: first token {ttft} · total {latency['total']:.2f}s")
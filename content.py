@@ -0,0 +1,132 @@
+# content.py
+# -------------------------------------------------------
+# Portfolio content (skills, projects, timelines) lives in
+# content/<section>.json rather than in app.py. Each section
+# file is loaded the first time its section renders,
+# validated once per load, kept in-process, and reloaded
+# when its mtime changes. Editing a file updates the
+# running app; no redeploy or model reload needed.
+# -------------------------------------------------------
+
+import json
+import logging
+import os
+import threading
+import time
+
+CONTENT_DIR = os.environ.get("PORTFOLIO_CONTENT_DIR", "content")
+# How long a loaded section is trusted before its mtime is checked again
+DEFAULT_REVALIDATE_SECONDS = float(os.environ.get("PORTFOLIO_CONTENT_REVALIDATE", 2))
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_FIELDS = {"when": str, "title": str, "where": str, "detail": str, "logo": str}
+
+# Section -> required fields of each entry (None: any type, may be null)
+SCHEMAS = {
+    "skills": {"category": str, "skills": list},
+    "projects": {"title": str, "desc": str, "tags": list, "img": str, "repo": None, "demo": None},
+    "education": TIMELINE_FIELDS,
+    "internships": TIMELINE_FIELDS,
+    "certifications": TIMELINE_FIELDS,
+}
+SKILL_FIELDS = {"name": str, "icon": str}
+
+
+class ContentError(ValueError):
+    """A content file is missing, unparsable or does not match its schema."""
+
+
+def _check_fields(entry, fields, where):
+    if not isinstance(entry, dict):
+        raise ContentError(f"{where}: expected an object, got {type(entry).__name__}")
+    for field, kind in fields.items():
+        if field not in entry:
+            raise ContentError(f"{where}: missing {field!r}")
+        if kind is not None and not isinstance(entry[field], kind):
+            raise ContentError(f"{where}: {field!r} should be {kind.__name__}")
+
+
+def validate(section, entries, path=""):
+    where = path or section
+    if not isinstance(entries, list):
+        raise ContentError(f"{where}: expected a list of entries")
+    for i, entry in enumerate(entries):
+        _check_fields(entry, SCHEMAS[section], f"{where}[{i}]")
+        if section == "skills":
+            for j, skill in enumerate(entry["skills"]):
+                _check_fields(skill, SKILL_FIELDS, f"{where}[{i}].skills[{j}]")
+        if section == "projects" and not all(isinstance(t, str) for t in entry["tags"]):
+            raise ContentError(f"{where}[{i}]: tags should be strings")
+    return entries
+
+
+class ContentStore:
+    """Lazily loaded, validated, mtime-reloaded content sections."""
+
+    def __init__(self, directory=CONTENT_DIR, revalidate_seconds=DEFAULT_REVALIDATE_SECONDS):
+        self.directory = directory
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._sections = {}   # section -> (checked_at, mtime_ns, entries)
+        self.loads = 0
+        self.reload_errors = 0
+
+    def path(self, section):
+        return os.path.join(self.directory, f"{section}.json")
+
+    def get(self, section):
+        """Entries for ``section``; raises ContentError if it has never loaded cleanly."""
+        if section not in SCHEMAS:
+            raise KeyError(f"Unknown content section {section!r}")
+        now = time.monotonic()
+        with self._lock:
+            cached = self._sections.get(section)
+            if cached and now - cached[0] < self.revalidate_seconds:
+                return cached[2]
+            path = self.path(section)
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError as e:
+                if cached:
+                    return cached[2]
+                raise ContentError(f"{path}: {e.strerror}") from e
+            if cached and cached[1] == mtime:
+                self._sections[section] = (now, mtime, cached[2])
+                return cached[2]
+            try:
+                entries = self._load(section, path)
+            except ContentError as e:
+                if not cached:
+                    raise
+                # Keep serving the last good version while the file is being fixed
+                self.reload_errors += 1
+                logger.warning("Keeping previous %s content: %s", section, e)
+                self._sections[section] = (now, mtime, cached[2])
+                return cached[2]
+            self._sections[section] = (now, mtime, entries)
+            return entries
+
+    def _load(self, section, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            raise ContentError(f"{path}: {e}") from e
+        validate(section, entries, path)
+        self.loads += 1
+        logger.info("Loaded %d %s entries from %s", len(entries), section, path)
+        return entries
+
+    def version(self, section):
+        """mtime of the loaded ``section`` (loading it if needed); a cheap cache key."""
+        self.get(section)
+        with self._lock:
+            return self._sections[section][1]
+
+    def loaded(self):
+        with self._lock:
+            return sorted(self._sections)
+
+
+content_store = ContentStore()
@@ -0,0 +1,186 @@
+# export_static.py
+# -------------------------------------------------------
+# Build step: pre-renders the portfolio into a static HTML
+# bundle for a CDN / edge host, so most visitors never hold
+# a Streamlit session or websocket.
+#
+#   python export_static.py                       # -> dist/
+#   python export_static.py --out public --app-url https://<app>.streamlit.app
+#
+# The same sections app.py shows (hero, about, skills, the
+# PROJECTS grid, timelines, resume link, socials) come from
+# the same content/ files and cards.py markup. Project
+# filtering/search, the timeline tabs and the mailto contact
+# form run client-side (templates/static_page.js), using the
+# tokens ProjectIndex extracts so results match the app.
+# Only the assistant stays live: with --app-url (or
+# PORTFOLIO_APP_URL) the page lazily embeds the app's
+# ?view=assistant page; without it the section is left out.
+#
+# Images, the stylesheet, the script and the resume are
+# written under static/_h/ with content-hashed names (see
+# assets.publish), so they can be cached forever; only
+# index.html needs revalidating.
+# -------------------------------------------------------
+
+import argparse
+import html
+import json
+import os
+import re
+import shutil
+import string
+from datetime import datetime
+
+import cards
+from assets import COVER_WIDTH, EXPORT_MODE, HASHED_SUBDIR, STATIC_DIR, asset_url, preload_html
+from content import ContentStore
+from project_index import ProjectIndex
+from theme import STYLESHEETS, SiteStylesheet
+
+TEMPLATE_DIR = "templates"
+PAGE_TEMPLATE = os.path.join(TEMPLATE_DIR, "static_page.html")
+PAGE_SCRIPT = os.path.join(TEMPLATE_DIR, "static_page.js")
+EXPORT_STYLESHEETS = STYLESHEETS + ("export.css",)
+EXPORT_CSS_PATH = os.path.join(".cache", "export.css")
+APP_URL = os.environ.get("PORTFOLIO_APP_URL", "")
+OUT_DIR = "dist"
+CONTACT_EMAIL = "anshkedia.04@gmail.com"
+RESUME_PATH = "Resume.pdf"
+# Covers in the first row load eagerly, as in app.py
+FIRST_ROW = 3
+TIMELINE_TABS = (("education", "Education"), ("internships", "Internships"), ("certifications", "Certifications"))
+
+_ASSET_REF = re.compile(r"static/(" + re.escape(HASHED_SUBDIR) + r"/[^\"')\s]+)")
+
+
+def skills_html(groups):
+    """Skill groups alternating between two columns, like app.py."""
+    columns = ["", ""]
+    for i, group in enumerate(groups):
+        columns[i % 2] += f"<h3>{group['category']}</h3>" + "".join(cards.skill_card_html(s) for s in group["skills"])
+    return "".join(f"<div>{c}</div>" for c in columns)
+
+
+def projects_html(projects):
+    out = []
+    for i, p in enumerate(projects):
+        img_attrs = 'loading="eager" fetchpriority="high"' if i < FIRST_ROW else 'loading="lazy"'
+        out.append(f'<div data-project="{i}">{cards.project_card_html(p, img_attrs, EXPORT_MODE)}</div>')
+    return "".join(out)
+
+
+def project_index_json(index):
+    """Tags and search tokens per project, in catalogue order, for the client-side filter."""
+    rows = [{"tags": list(p["tags"]), "tokens": sorted(tokens)} for p, tokens in zip(index.projects, index.tokens)]
+    # Safe inside <script>: no "</" can close the element early
+    return json.dumps(rows, separators=(",", ":"), ensure_ascii=False).replace("</", "<\\/")
+
+
+def timeline_html(store):
+    buttons, panels = [], []
+    for i, (section, label) in enumerate(TIMELINE_TABS):
+        selected = "true" if i == 0 else "false"
+        buttons.append(f'<button type="button" class="tab" role="tab" data-tab="{section}" aria-selected="{selected}">{label}</button>')
+        items = "".join(cards.timeline_item_html(it, EXPORT_MODE) for it in store.get(section))
+        panels.append(f'<div class="timeline" role="tabpanel" data-panel="{section}"{"" if i == 0 else " hidden"}>{items}</div>')
+    return "".join(buttons), "".join(panels)
+
+
+def assistant_html(app_url):
+    if not app_url:
+        return ""
+    src = html.escape(f"{app_url.rstrip('/')}/?view=assistant&embed=true")
+    return (
+        '<div class="hr"></div><section id="assistant">'
+        "<h3 class='chat-heading'>🤖 Ask Me Anything</h3>"
+        f'<iframe class="assistant-frame" src="{src}" loading="lazy" title="Ask me anything"></iframe>'
+        "</section>"
+    )
+
+
+def render(store, app_url=APP_URL):
+    """The full page; every local asset it references is published under static/_h/."""
+    projects = store.get("projects")
+    index = ProjectIndex(projects)
+    tab_buttons, tab_panels = timeline_html(store)
+    resume_url = asset_url(RESUME_PATH, EXPORT_MODE) if os.path.isfile(RESUME_PATH) else ""
+    stylesheet = SiteStylesheet(EXPORT_STYLESHEETS, EXPORT_CSS_PATH, revalidate_seconds=0)
+
+    with open(PAGE_TEMPLATE, encoding="utf-8") as f:
+        template = string.Template(f.read())
+    return template.substitute(
+        preloads="".join(preload_html(p["img"], COVER_WIDTH, EXPORT_MODE) for p in projects[:FIRST_ROW]),
+        stylesheet=stylesheet.html(EXPORT_MODE),
+        badge=cards.BADGE_HTML,
+        title=cards.TITLE_HTML,
+        roles=html.escape(json.dumps(cards.TYPING_ROLES, ensure_ascii=False)),
+        intro=cards.INTRO_HTML,
+        quick_peek=cards.QUICK_PEEK_HTML,
+        connect=cards.CONNECT_HTML,
+        skills=skills_html(store.get("skills")),
+        tag_buttons="".join(
+            f'<button type="button" class="chip" data-tag="{html.escape(t)}" aria-pressed="false">{html.escape(t)}</button>'
+            for t in index.tags
+        ),
+        projects=projects_html(projects),
+        project_index=project_index_json(index),
+        tab_buttons=tab_buttons,
+        tab_panels=tab_panels,
+        resume_card=cards.RESUME_CARD_HTML,
+        resume_link=cards.resume_link_html(resume_url) if resume_url else "",
+        contact_email=CONTACT_EMAIL,
+        socials=cards.SOCIALS_HTML,
+        assistant=assistant_html(app_url),
+        footer=cards.footer_html(datetime.now().year),
+        script=asset_url(PAGE_SCRIPT, EXPORT_MODE),
+    )
+
+
+def copy_assets(page, out_dir):
+    """Copy every static/_h/ file ``page`` references into ``out_dir``; prune stale ones."""
+    names = set(_ASSET_REF.findall(page))
+    total = 0
+    for name in sorted(names):
+        src = os.path.join(STATIC_DIR, name)
+        dest = os.path.join(out_dir, STATIC_DIR, name)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        if not os.path.exists(dest):
+            shutil.copyfile(src, dest)
+        total += os.path.getsize(dest)
+    hashed_dir = os.path.join(out_dir, STATIC_DIR, HASHED_SUBDIR)
+    for entry in os.listdir(hashed_dir) if os.path.isdir(hashed_dir) else ():
+        if f"{HASHED_SUBDIR}/{entry}" not in names:
+            os.remove(os.path.join(hashed_dir, entry))
+    return len(names), total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-render the portfolio into a static HTML bundle.")
+    parser.add_argument("--out", default=OUT_DIR, help="output directory")
+    parser.add_argument("--app-url", default=APP_URL, help="live Streamlit app to embed for the assistant")
+    args = parser.parse_args()
+
+    store = ContentStore(revalidate_seconds=0)
+    # The skills grid must not load icons from third-party hosts (see bundle_icons.py)
+    external = cards.external_srcs(skills_html(store.get("skills")))
+    if external:
+        raise SystemExit(f"{len(external)} skill icon(s) load from third-party hosts, e.g. {external[0]}")
+    page = render(store, args.app_url)
+    os.makedirs(args.out, exist_ok=True)
+    tmp = os.path.join(args.out, f"index.html.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(page)
+    count, nbytes = copy_assets(page, args.out)
+    os.replace(tmp, os.path.join(args.out, "index.html"))
+
+    print(f"{args.out}/index.html: {len(page.encode()) / 1024:.1f} KB, {count} hashed assets ({nbytes / 1024:.1f} KB)")
+    if not args.app_url:
+        print("no --app-url: the assistant section is left out")
+    missing = cards.unbundled_icons(store.get("skills"))
+    if missing:
+        print(f"{len(missing)} skill icon(s) not bundled (placeholders shown): run python bundle_icons.py --fetch")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# fragments.py
+# -------------------------------------------------------
+# Process-wide cache of rendered HTML fragments (project
+# cards, skill cards, timeline items). A fragment is keyed
+# by its kind, a hash of the item's content and whatever
+# else changes the markup (asset mode, theme, resolved
+# image files), so it is built once per process and
+# shared by every session and rerun. Per-rerun counters
+# show how many were rebuilt.
+# -------------------------------------------------------
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 2048
+
+
+def content_hash(item):
+    """Stable digest of a JSON-like item (dict / list / tuple / scalars)."""
+    blob = json.dumps(item, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha1(blob.encode("utf-8")).hexdigest()
+
+
+class FragmentCache:
+    """LRU map of (kind, content hash, *variant) -> HTML string."""
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # Every session's rerun runs on its own thread, so per-rerun counts are thread-local
+        self._rerun = threading.local()
+        self.hits = 0
+        self.builds = 0
+        self.evictions = 0
+
+    def start_rerun(self):
+        """Reset the calling thread's per-rerun counters."""
+        self._rerun.hits = 0
+        self._rerun.builds = 0
+
+    def _count(self, name):
+        setattr(self._rerun, name, getattr(self._rerun, name, 0) + 1)
+
+    def get(self, kind, item, build, *variant):
+        """Cached HTML for ``item``; ``build(item)`` on a miss."""
+        key = (kind, content_hash(item)) + variant
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self._count("hits")
+                return html
+        html = build(item)
+        with self._lock:
+            self._entries[key] = html
+            self.builds += 1
+            self._count("builds")
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def rerun_stats(self):
+        """Hits and rebuilds since the calling thread's last ``start_rerun``."""
+        return {"hits": getattr(self._rerun, "hits", 0), "builds": getattr(self._rerun, "builds", 0)}
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "builds": self.builds,
+                "evictions": self.evictions,
+                "last_rerun": self.rerun_stats(),
+            }
+
+
+fragment_cache = FragmentCache()
@@ -0,0 +1,95 @@
+# ingest.py
+# -------------------------------------------------------
+# Document ingestion for the chatbot knowledge base:
+# discovers PDF / txt / markdown sources, parses them in a
+# process pool, and embeds chunks in fixed-size batches.
+# Every source gets a report line (timings or the error)
+# instead of being silently skipped.
+# Loaders are imported on first use, not at import time.
+# -------------------------------------------------------
+
+import glob
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# extension -> langchain_community.document_loaders class name
+LOADERS = {
+    ".pdf": "PyPDFLoader",
+    ".txt": "TextLoader",
+    ".md": "TextLoader",
+}
+# Below this many files a pool costs more (process spawn + imports) than it saves
+POOL_MIN_FILES = 4
+
+
+def discover(files=(), directory=None):
+    """Existing, supported files from ``files`` plus everything under ``directory``."""
+    found = [f for f in files if os.path.isfile(f)]
+    if directory and os.path.isdir(directory):
+        for path in sorted(glob.glob(os.path.join(directory, "**", "*"), recursive=True)):
+            if os.path.splitext(path)[1].lower() in LOADERS and path not in found:
+                found.append(path)
+    return found
+
+
+def parse_file(path):
+    """Load one file. Returns (path, documents, seconds, error); runs in pool workers."""
+    t0 = time.perf_counter()
+    try:
+        from langchain_community import document_loaders
+
+        name = LOADERS[os.path.splitext(path)[1].lower()]
+        kwargs = {"encoding": "utf-8"} if name == "TextLoader" else {}
+        docs = getattr(document_loaders, name)(path, **kwargs).load()
+        return path, docs, time.perf_counter() - t0, None
+    except Exception as e:
+        return path, [], time.perf_counter() - t0, f"{type(e).__name__}: {e}"
+
+
+def parse_files(paths, workers=None):
+    """Parse ``paths`` in a process pool (serially for small inputs), in input order."""
+    if workers == 1 or len(paths) < POOL_MIN_FILES:
+        return [parse_file(p) for p in paths]
+    # spawn, not fork: the parent may already hold torch / tokenizer threads
+    ctx = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+            return list(pool.map(parse_file, paths))
+    except (BrokenProcessPool, OSError):
+        # e.g. workers cannot be spawned in this environment
+        return [parse_file(p) for p in paths]
+
+
+def project_documents(projects):
+    """One Document per portfolio project (title, description, tags, links)."""
+    from langchain_core.documents import Document
+
+    docs = []
+    for p in projects:
+        lines = [f"Project: {p['title']}", p["desc"], "Tech stack: " + ", ".join(p["tags"])]
+        if p.get("repo"):
+            lines.append(f"Repository: {p['repo']}")
+        if p.get("demo"):
+            lines.append(f"Live demo: {p['demo']}")
+        docs.append(Document(page_content="\n".join(lines), metadata={"source": "projects", "title": p["title"]}))
+    return docs
+
+
+def embed_in_batches(embeddings, texts, batch_size=64):
+    """``embeddings.embed_documents`` over ``texts``, ``batch_size`` at a time."""
+    vectors = []
+    for i in range(0, len(texts), batch_size):
+        vectors.extend(embeddings.embed_documents(texts[i:i + batch_size]))
+    return vectors
+
+
+def format_report(report):
+    """Plain-text table of per-source ingestion results."""
+    lines = [f"{'source':<40} {'chunks':>6} {'parse s':>8} {'embed s':>8}  status"]
+    for r in report:
+        status = r["error"] or "ok"
+        lines.append(f"{r['source']:<40} {r['chunks']:>6} {r['parse_s']:>8.2f} {r['embed_s']:>8.2f}  {status}")
+    return "\n".join(lines)
@@ -0,0 +1,238 @@
+# llm_backends.py
+# -------------------------------------------------------
+# Inference backends for the chatbot's seq2seq model. Each
+# one returns a model that the transformers
+# "text2text-generation" pipeline (and therefore
+# HuggingFacePipeline) can drive unchanged:
+#   torch - full-precision PyTorch (the original setup)
+#   int8  - PyTorch with Linear layers dynamically quantized
+#   onnx  - ONNX Runtime via optimum; exported once, then
+#           loaded from ONNX_CACHE_DIR on later starts
+# BatchScheduler lets every session share one model copy by
+# running concurrent prompts as a single padded batch.
+# transformers is imported only when a model is built, so
+# importing this module (e.g. for DEFAULT_BACKEND) is cheap.
+# -------------------------------------------------------
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+BACKENDS = ("torch", "int8", "onnx")
+DEFAULT_BACKEND = os.environ.get("CHATBOT_LLM_BACKEND", "torch")
+ONNX_CACHE_DIR = os.environ.get("CHATBOT_ONNX_DIR", ".cache/onnx")
+
+
+def load_torch(model_name):
+    from transformers import AutoModelForSeq2SeqLM
+
+    return AutoModelForSeq2SeqLM.from_pretrained(model_name)
+
+
+def load_int8(model_name):
+    import torch
+    from transformers import AutoModelForSeq2SeqLM
+
+    model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def load_onnx(model_name):
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError as e:
+        raise ImportError("The onnx backend needs `pip install optimum[onnxruntime]`.") from e
+
+    export_dir = os.path.join(ONNX_CACHE_DIR, model_name.replace("/", "--"))
+    if os.path.isfile(os.path.join(export_dir, "config.json")):
+        return ORTModelForSeq2SeqLM.from_pretrained(export_dir)
+    model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True)
+    model.save_pretrained(export_dir)
+    return model
+
+
+LOADERS = {
+    "torch": load_torch,
+    "int8": load_int8,
+    "onnx": load_onnx,
+}
+
+
+def build_pipeline(model_name, backend=DEFAULT_BACKEND, max_length=256):
+    """transformers text2text pipeline for ``model_name`` on ``backend``."""
+    if backend not in LOADERS:
+        raise ValueError(f"Unknown LLM backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+    from transformers import AutoTokenizer, pipeline
+
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = LOADERS[backend](model_name)
+    return pipeline("text2text-generation", model=model, tokenizer=tokenizer, max_length=max_length)
+
+
+# =========================
+# Micro-batching
+# =========================
+_DONE = object()
+
+
+class _Request:
+    __slots__ = ("prompt", "future", "chunks")
+
+    def __init__(self, prompt, stream):
+        self.prompt = prompt
+        self.future = Future()
+        self.chunks = queue.Queue() if stream else None
+
+
+class _BatchStreamer:
+    """Splits the batched tokens ``generate`` emits per step into per-request text deltas.
+
+    Implements the transformers BaseStreamer protocol (``put`` / ``end``);
+    ``generate`` only calls those two, so no transformers import is needed here.
+    """
+
+    def __init__(self, tokenizer, requests):
+        self.tokenizer = tokenizer
+        self.requests = requests
+        self.tokens = [[] for _ in requests]
+        self.texts = [""] * len(requests)
+        self.finished = [r.chunks is None for r in requests]
+        self.skip_first = True
+
+    def put(self, value):
+        if self.skip_first:
+            # The first call carries the decoder start tokens, not output.
+            self.skip_first = False
+            return
+        step = value.reshape(len(self.requests), -1)[:, -1].tolist()
+        for i, token in enumerate(step):
+            if self.finished[i]:
+                continue
+            if token == self.tokenizer.eos_token_id:
+                self.finished[i] = True
+                continue
+            self.tokens[i].append(token)
+            text = self.tokenizer.decode(self.tokens[i], skip_special_tokens=True)
+            if len(text) > len(self.texts[i]):
+                self.requests[i].chunks.put(text[len(self.texts[i]):])
+                self.texts[i] = text
+
+    def end(self):
+        pass
+
+
+class BatchScheduler:
+    """Collects prompts from concurrent sessions and runs them as one padded batch.
+
+    A batch starts once ``max_batch_size`` prompts are waiting or the oldest
+    has waited ``max_wait`` seconds. Every prompt gets its own Future;
+    ``stream`` additionally yields the answer as it is generated.
+    """
+
+    def __init__(self, pipe, max_batch_size=8, max_wait=0.02, max_length=256):
+        self.pipe = pipe
+        self.model = pipe.model
+        self.tokenizer = pipe.tokenizer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_length = max_length
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.requests = 0
+        self.max_queue_depth = 0
+        threading.Thread(target=self._run, name="llm-batcher", daemon=True).start()
+
+    @property
+    def queue_depth(self):
+        return self._queue.qsize()
+
+    def _enqueue(self, prompt, stream):
+        req = _Request(prompt, stream)
+        self._queue.put(req)
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, self._queue.qsize())
+        return req
+
+    def submit(self, prompt):
+        """Future resolving to the generated text for ``prompt``."""
+        return self._enqueue(prompt, stream=False).future
+
+    def stream(self, prompt):
+        """Yield text chunks for ``prompt`` as its batch generates them."""
+        req = self._enqueue(prompt, stream=True)
+        while True:
+            chunk = req.chunks.get()
+            if chunk is _DONE:
+                break
+            yield chunk
+        req.future.result()  # re-raise generation errors
+
+    # ---------- worker ----------
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            self._generate(batch)
+
+    def _generate(self, batch):
+        try:
+            enc = self.tokenizer([r.prompt for r in batch], return_tensors="pt", padding=True, truncation=True)
+            streamer = _BatchStreamer(self.tokenizer, batch) if any(r.chunks for r in batch) else None
+            output = self.model.generate(
+                input_ids=enc["input_ids"],
+                attention_mask=enc["attention_mask"],
+                max_length=self.max_length,
+                streamer=streamer,
+            )
+            texts = self.tokenizer.batch_decode(output, skip_special_tokens=True)
+            with self._lock:
+                self.batches += 1
+                self.requests += len(batch)
+            for req, text in zip(batch, texts):
+                req.future.set_result(text)
+        except Exception as e:
+            for req in batch:
+                if not req.future.done():
+                    req.future.set_exception(e)
+        finally:
+            for req in batch:
+                if req.chunks is not None:
+                    req.chunks.put(_DONE)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "queue_depth": self.queue_depth,
+                "max_queue_depth": self.max_queue_depth,
+                "batches": self.batches,
+                "requests": self.requests,
+                "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+            }
+
+
+class BatchedPipeline:
+    """Stands in for a transformers pipeline inside HuggingFacePipeline,
+    routing calls through a shared BatchScheduler."""
+
+    def __init__(self, scheduler):
+        self.scheduler = scheduler
+
+    def __call__(self, inputs, **kwargs):
+        prompts = [inputs] if isinstance(inputs, str) else list(inputs)
+        futures = [self.scheduler.submit(p) for p in prompts]
+        return [{"generated_text": f.result()} for f in futures]
+
+    def __getattr__(self, name):
+        # task, tokenizer, model, ... come from the wrapped pipeline
+        return getattr(self.scheduler.pipe, name)
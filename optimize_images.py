@@ -0,0 +1,121 @@
+# optimize_images.py
+# -------------------------------------------------------
+# Build step: writes downscaled WebP/AVIF variants of the
+# logos and project covers at the sizes app.py displays
+# them (1x and 2x), plus a manifest that assets.py uses to
+# pick the smallest suitable file at render time.
+#
+#   python optimize_images.py           # rebuild changed sources
+#   python optimize_images.py --force   # rebuild everything
+#
+# Needs Pillow (installed with Streamlit). AVIF is skipped
+# when the local Pillow build lacks an AVIF encoder.
+# -------------------------------------------------------
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+
+from PIL import Image, ImageOps, features
+
+from assets import COVER_WIDTH, DENSITIES, LOGO_SIZE, MANIFEST_PATH, VARIANTS_DIR
+
+# (glob, display box in CSS px). A None height keeps the aspect ratio.
+TARGETS = [
+    ("logos/*", (LOGO_SIZE, LOGO_SIZE)),
+    ("Project_images/*", (COVER_WIDTH, None)),
+]
+ENCODERS = {
+    "webp": {"quality": 80, "method": 6},
+    "avif": {"quality": 55, "speed": 4},
+}
+
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def resize(img, box, density):
+    """Downscale ``img`` to fit ``box`` at ``density``; never upscale."""
+    bw, bh = box
+    tw = bw * density
+    th = bh * density if bh else None
+    scale = min(tw / img.width, (th / img.height) if th else tw / img.width, 1.0)
+    size = (max(1, round(img.width * scale)), max(1, round(img.height * scale)))
+    return img if size == img.size else img.resize(size, Image.LANCZOS)
+
+
+def build_variants(src, box, formats):
+    with Image.open(src) as im:
+        im = ImageOps.exif_transpose(im)
+        im = im.convert("RGBA" if im.mode in ("RGBA", "LA", "P") else "RGB")
+
+        stem = os.path.splitext(src)[0]
+        variants, seen = [], set()
+        for density in DENSITIES:
+            out = resize(im, box, density)
+            if out.size in seen:
+                # Small sources: 2x would be the same pixels as 1x.
+                continue
+            seen.add(out.size)
+            for fmt in formats:
+                dest = os.path.join(VARIANTS_DIR, f"{stem}-{out.width}w.{fmt}")
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                out.save(dest, fmt.upper(), **ENCODERS[fmt])
+                variants.append({
+                    "path": dest.replace(os.sep, "/"),
+                    "format": fmt,
+                    "width": out.width,
+                    "height": out.height,
+                    "density": density,
+                    "bytes": os.path.getsize(dest),
+                })
+    return variants
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build resized image variants for app.py.")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the source is unchanged")
+    args = parser.parse_args()
+
+    formats = [f for f in ENCODERS if features.check(f)]
+    try:
+        with open(MANIFEST_PATH) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {"version": 1, "sources": {}}
+    old = manifest.get("sources", {})
+
+    sources, before, after = {}, 0, 0
+    for pattern, box in TARGETS:
+        for src in sorted(glob.glob(pattern)):
+            src = src.replace(os.sep, "/")
+            digest = sha256_file(src)
+            entry = old.get(src)
+            if args.force or not entry or entry.get("sha256") != digest or entry.get("box") != list(box):
+                entry = {
+                    "sha256": digest,
+                    "bytes": os.path.getsize(src),
+                    "box": list(box),
+                    "variants": build_variants(src, box, formats),
+                }
+            sources[src] = entry
+            smallest = min((v["bytes"] for v in entry["variants"] if v["density"] == max(DENSITIES)), default=entry["bytes"])
+            before += entry["bytes"]
+            after += smallest
+            print(f"{src:<32} {entry['bytes'] / 1024:8.1f} KB -> {smallest / 1024:6.1f} KB")
+
+    os.makedirs(os.path.dirname(MANIFEST_PATH), exist_ok=True)
+    with open(MANIFEST_PATH, "w") as f:
+        json.dump({"version": 1, "formats": formats, "sources": sources}, f, indent=1, sort_keys=True)
+    print(f"\n{len(sources)} images: {before / 1024:.0f} KB -> {after / 1024:.0f} KB at 2x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# project_index.py
+# -------------------------------------------------------
+# Search index over the PROJECTS grid, built once per
+# process instead of rescanning every project per rerun:
+#   tag    -> project ids
+#   prefix -> project ids (edge n-grams of every title and
+#             description token, pre-lowercased)
+# Filtering is set intersection / union over those posting
+# sets, so it costs the size of the result, not the catalogue.
+# -------------------------------------------------------
+
+import re
+from collections import defaultdict
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+# Prefixes longer than this are verified against the full token list
+MAX_PREFIX = 12
+
+
+def tokenize(text):
+    return _TOKEN.findall(text.lower())
+
+
+class ProjectIndex:
+    """Tag and prefix index over a list of project dicts (title, desc, tags)."""
+
+    def __init__(self, projects):
+        self.projects = list(projects)
+        self.by_tag = defaultdict(set)
+        self.by_prefix = defaultdict(set)
+        self.tokens = []
+        for pid, p in enumerate(self.projects):
+            for tag in p.get("tags", ()):
+                self.by_tag[tag].add(pid)
+            tokens = set(tokenize(f"{p.get('title', '')} {p.get('desc', '')}"))
+            self.tokens.append(tokens)
+            for token in tokens:
+                for n in range(1, min(len(token), MAX_PREFIX) + 1):
+                    self.by_prefix[token[:n]].add(pid)
+        self.all_ids = frozenset(range(len(self.projects)))
+        self.tags = sorted(self.by_tag)
+
+    def __len__(self):
+        return len(self.projects)
+
+    def match_tags(self, tags, mode="any"):
+        """Ids carrying any (or, with mode="all", every) tag in ``tags``; all ids if empty."""
+        if not tags:
+            return self.all_ids
+        sets = [self.by_tag.get(t, set()) for t in tags]
+        if mode == "all":
+            return set.intersection(*sets)
+        return set.union(*sets)
+
+    def match_text(self, query):
+        """Ids where every query word is a prefix of some title/description word."""
+        ids = None
+        for term in tokenize(query):
+            hits = self.by_prefix.get(term[:MAX_PREFIX], set())
+            if len(term) > MAX_PREFIX:
+                hits = {pid for pid in hits if any(t.startswith(term) for t in self.tokens[pid])}
+            ids = hits if ids is None else ids & hits
+            if not ids:
+                return set()
+        return self.all_ids if ids is None else ids
+
+    def filter(self, tags=(), query="", mode="any"):
+        """Matching projects in catalogue order."""
+        ids = self.match_tags(tags, mode)
+        if query:
+            ids = ids & self.match_text(query)
+        return [self.projects[pid] for pid in sorted(ids)]
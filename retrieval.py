@@ -0,0 +1,162 @@
+# retrieval.py
+# -------------------------------------------------------
+# Lexical (BM25) inverted index built alongside the FAISS
+# store, and a hybrid retriever that fuses both rankings.
+# Exact keyword hits (project names like "BrickWise") are
+# found without an embedding pass: when BM25 is confident
+# the retriever answers from the inverted index alone.
+# -------------------------------------------------------
+
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Any, Dict, List
+
+import numpy as np
+from langchain_core.callbacks import CallbackManagerForRetrieverRun
+from langchain_core.documents import Document
+from langchain_core.retrievers import BaseRetriever
+from pydantic import Field
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by do does for from has have he her his how i in is it its "
+    "me my of on or she that the their them they this to was what when where which who "
+    "why will with you your about tell can did".split()
+)
+
+
+def tokenize(text):
+    return [t for t in _TOKEN.findall(text.lower()) if t not in STOPWORDS]
+
+
+class BM25Index:
+    """Okapi BM25 over an inverted index: term -> {doc id: term frequency}."""
+
+    def __init__(self, k1=1.5, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self.postings = defaultdict(dict)
+        self.lengths = {}
+        self._total_length = 0
+
+    @classmethod
+    def from_texts(cls, items, **kwargs):
+        """Build from (doc id, text) pairs."""
+        index = cls(**kwargs)
+        for doc_id, text in items:
+            index.add(doc_id, text)
+        return index
+
+    def add(self, doc_id, text):
+        tokens = tokenize(text)
+        for term, tf in Counter(tokens).items():
+            self.postings[term][doc_id] = tf
+        self.lengths[doc_id] = len(tokens)
+        self._total_length += len(tokens)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def idf(self, term):
+        df = len(self.postings.get(term, ()))
+        if not df:
+            return 0.0
+        n = len(self.lengths)
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(self, query, k=10):
+        """Top ``k`` (doc id, score) pairs, plus a 0..1 confidence for the best hit.
+
+        Confidence is the share of the query's IDF weight that the best document
+        matches. Terms missing from the vocabulary count at the highest IDF, so a
+        query BM25 cannot cover falls back to vector search.
+        """
+        if not self.lengths:
+            return [], 0.0
+        n = len(self.lengths)
+        avg_len = self._total_length / n
+        unseen_idf = math.log(1 + (n + 0.5) / 0.5)
+        scores = defaultdict(float)
+        matched = defaultdict(float)
+        total = 0.0
+        for term in set(tokenize(query)):
+            idf = self.idf(term)
+            if not idf:
+                total += unseen_idf
+                continue
+            total += idf
+            for doc_id, tf in self.postings[term].items():
+                norm = tf + self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / avg_len)
+                scores[doc_id] += idf * tf * (self.k1 + 1) / norm
+                matched[doc_id] += idf
+        top = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)[:k]
+        confidence = matched[top[0][0]] / total if top else 0.0
+        return top, confidence
+
+
+class HybridRetriever(BaseRetriever):
+    """Fuses FAISS similarity with BM25.
+
+    mode:   "hybrid" (both, fused), "keyword" (BM25 only) or "vector" (FAISS only)
+    fusion: "rrf" (reciprocal rank fusion) or "weighted" (alpha * vector + (1 - alpha) * BM25,
+            each min-max normalized)
+    In hybrid mode a BM25 confidence >= ``fast_path_confidence`` skips the embedding pass.
+    """
+
+    vectorstore: Any
+    lexical: Any
+    k: int = 3
+    mode: str = "hybrid"
+    fusion: str = "rrf"
+    alpha: float = 0.5
+    rrf_k: int = 60
+    fast_path_confidence: float = 0.8
+    stats: Dict[str, int] = Field(default_factory=lambda: {"keyword_fast_path": 0, "fused": 0, "vector": 0})
+
+    def _docs(self, ids):
+        docs = []
+        for doc_id in ids:
+            doc = self.vectorstore.docstore.search(doc_id)
+            if isinstance(doc, Document):
+                docs.append(doc)
+        return docs
+
+    def _get_relevant_documents(self, query: str, *, run_manager: CallbackManagerForRetrieverRun) -> List[Document]:
+        pool = self.k * 4
+        if self.mode != "vector":
+            lexical, confidence = self.lexical.search(query, pool)
+            if self.mode == "keyword" or (lexical and confidence >= self.fast_path_confidence):
+                self.stats["keyword_fast_path"] += 1
+                return self._docs([doc_id for doc_id, _ in lexical[:self.k]])
+
+        id_of = self.vectorstore.index_to_docstore_id
+        vec = self.vectorstore.embedding_function.embed_query(query)
+        distances, rows = self.vectorstore.index.search(np.asarray([vec], dtype=np.float32), pool)
+        # FAISS L2 distance: smaller is closer
+        vector = [(id_of[int(r)], -float(d)) for d, r in zip(distances[0], rows[0]) if r != -1]
+        if self.mode == "vector" or not lexical:
+            self.stats["vector"] += 1
+            return self._docs([doc_id for doc_id, _ in vector[:self.k]])
+
+        self.stats["fused"] += 1
+        fused = defaultdict(float)
+        if self.fusion == "weighted":
+            for weight, ranking in ((self.alpha, vector), (1 - self.alpha, lexical)):
+                for doc_id, score in _min_max(ranking):
+                    fused[doc_id] += weight * score
+        else:
+            for ranking in (vector, lexical):
+                for rank, (doc_id, _) in enumerate(ranking):
+                    fused[doc_id] += 1.0 / (self.rrf_k + rank + 1)
+        best = sorted(fused.items(), key=lambda kv: kv[1], reverse=True)[:self.k]
+        return self._docs([doc_id for doc_id, _ in best])
+
+
+def _min_max(ranking):
+    if not ranking:
+        return []
+    scores = [s for _, s in ranking]
+    lo, hi = min(scores), max(scores)
+    span = (hi - lo) or 1.0
+    return [(doc_id, (s - lo) / span) for doc_id, s in ranking]
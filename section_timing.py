@@ -0,0 +1,349 @@
+# section_timing.py
+# -------------------------------------------------------
+# Per-section profiling of app.py, per session and per process.
+# Full-page sections are delimited with ``page_section``
+# marks at each banner; st.fragment bodies use ``timed``.
+# Each record keeps the last value and how many times the
+# section ran, so a fragment interaction shows up as one
+# section re-running while the page counter stays put.
+# The first page run in a process is also checked against
+# a cold-start budget (imports + first full render).
+#
+# Wall time is always recorded. Profiling is opt-in (?profile=1
+# for one session, PORTFOLIO_PROFILE=1 for every run) and adds,
+# per section (it hooks file opens and writes dumps, so
+# ?profile=1 is only honoured with PORTFOLIO_PROFILE_ALLOW=1
+# or in Streamlit's development mode):
+#   sent bytes   serialized element deltas sent to the browser
+#   files        files opened (sys audit "open" events)
+#   read/written bytes read()/write() by the script thread
+#                (/proc/thread-self/io; Linux only, else 0)
+# Profiled runs are summed per process and written after each
+# run as JSON and Prometheus text (node_exporter textfile
+# collector format) under PORTFOLIO_PROFILE_DIR.
+# -------------------------------------------------------
+
+import html
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+STATE_KEY = "section_timings"
+PAGE_RUNS_KEY = "page_runs"
+PROFILING_KEY = "profiling"
+# Seconds from importing this module (app.py does so first) to the end of the first page run
+COLD_START_BUDGET = float(os.environ.get("PORTFOLIO_COLD_START_BUDGET", 3.0))
+PROFILE_ALL = os.environ.get("PORTFOLIO_PROFILE", "").lower() in ("1", "true", "yes")
+# Lets visitors turn profiling on for their session with ?profile=1
+PROFILE_ALLOW = os.environ.get("PORTFOLIO_PROFILE_ALLOW", "").lower() in ("1", "true", "yes")
+PROFILE_DIR = os.environ.get("PORTFOLIO_PROFILE_DIR", os.path.join(".cache", "profile"))
+METRIC_PREFIX = "portfolio_section"
+# Counters kept per section on profiled runs, in overlay/dump order
+METRICS = ("sent_bytes", "files", "read_bytes", "written_bytes")
+
+logger = logging.getLogger(__name__)
+IMPORTED_AT = time.perf_counter()
+cold_start = None   # seconds, once the first page run has finished
+
+_THREAD_IO = "/proc/thread-self/io" if os.path.exists("/proc/thread-self/io") else None
+
+# Per script thread: the open page section, whether this run is profiled,
+# and the running counters the sections take deltas of
+_open = threading.local()
+
+# Process-wide sums over profiled runs: {section: {...}}
+_totals = {}
+_totals_lock = threading.Lock()
+_hook_installed = False
+
+
+# =========================
+# Counters
+# =========================
+def _audit(event, args):
+    if event == "open" and getattr(_open, "profiling", False) and not getattr(_open, "sampling", False):
+        _open.files = getattr(_open, "files", 0) + 1
+
+
+def _count_sent_bytes():
+    """Wrap this session's message queue so profiled runs count what they send."""
+    ctx = get_script_run_ctx()
+    if ctx is None or getattr(ctx._enqueue, "counts_bytes", False):
+        return
+    inner = ctx._enqueue
+
+    def enqueue(msg):
+        if getattr(_open, "profiling", False):
+            _open.sent_bytes = getattr(_open, "sent_bytes", 0) + msg.ByteSize()
+        inner(msg)
+
+    enqueue.counts_bytes = True
+    ctx._enqueue = enqueue
+
+
+def _thread_io():
+    """(read, written) bytes of this thread so far, excluding our own reads of the counter file."""
+    if _THREAD_IO is None:
+        return 0, 0
+    _open.sampling = True
+    try:
+        with open(_THREAD_IO, "rb") as f:
+            text = f.read()
+    except OSError:
+        return 0, 0
+    finally:
+        _open.sampling = False
+    fields = dict(line.split(b": ", 1) for line in text.splitlines() if b": " in line)
+    # rchar includes every earlier sample read; it does not include this one yet
+    overhead = getattr(_open, "sample_bytes", 0)
+    _open.sample_bytes = overhead + len(text)
+    return int(fields.get(b"rchar", 0)) - overhead, int(fields.get(b"wchar", 0))
+
+
+def _snapshot():
+    if not getattr(_open, "profiling", False):
+        return time.perf_counter(), None
+    read, written = _thread_io()
+    counters = (getattr(_open, "sent_bytes", 0), getattr(_open, "files", 0), read, written)
+    return time.perf_counter(), counters
+
+
+def _set_profiling(on):
+    global _hook_installed
+    _open.profiling = on
+    if on:
+        _count_sent_bytes()
+        if not _hook_installed:
+            # Audit hooks cannot be removed; when no run is profiled this is one attribute check per event
+            sys.addaudithook(_audit)
+            _hook_installed = True
+
+
+# =========================
+# Recording
+# =========================
+def _record(name, start, scope):
+    t0, before = start
+    t1, after = _snapshot()
+    seconds = t1 - t0
+    timings = st.session_state.setdefault(STATE_KEY, {})
+    entry = timings.setdefault(name, {"last_ms": 0.0, "runs": 0, "scope": scope})
+    entry["last_ms"] = seconds * 1000
+    entry["runs"] += 1
+    entry["scope"] = scope
+    if before is None or after is None:
+        return
+    deltas = dict(zip(METRICS, (b - a for a, b in zip(before, after))))
+    entry.update(deltas)
+    with _totals_lock:
+        total = _totals.setdefault(name, {"scope": scope, "runs": 0, "seconds": 0.0, **dict.fromkeys(METRICS, 0)})
+        total["runs"] += 1
+        total["seconds"] += seconds
+        total["last_seconds"] = seconds
+        for metric, value in deltas.items():
+            total[metric] += value
+
+
+def profile_requests_allowed():
+    """Whether a session may ask for profiling (PORTFOLIO_PROFILE_ALLOW or development mode)."""
+    return PROFILE_ALLOW or bool(st.get_option("global.developmentMode"))
+
+
+def start_page(profile=False):
+    """Call once at the top of app.py: counts a full-page run. Returns whether it is profiled.
+
+    ``profile`` (the session's request) is ignored unless profile_requests_allowed().
+    """
+    st.session_state[PAGE_RUNS_KEY] = st.session_state.get(PAGE_RUNS_KEY, 0) + 1
+    profiling = PROFILE_ALL or (bool(profile) and profile_requests_allowed())
+    st.session_state[PROFILING_KEY] = profiling
+    _open.section = None
+    _set_profiling(profiling)
+    return profiling
+
+
+def _close_section():
+    section = getattr(_open, "section", None)
+    if section is not None:
+        _record(section[0], section[1], "page")
+        _open.section = None
+
+
+def page_section(name):
+    """Close the open page section (if any) and start timing ``name``."""
+    _close_section()
+    _open.section = (name, _snapshot())
+
+
+def end_page():
+    """Close the open page section; call at the very end of app.py."""
+    global cold_start
+    _close_section()
+    if cold_start is None:
+        cold_start = time.perf_counter() - IMPORTED_AT
+        if cold_start > COLD_START_BUDGET:
+            logger.warning("Cold start took %.2fs (budget %.2fs); see benchmarks/startup.py", cold_start, COLD_START_BUDGET)
+        else:
+            logger.info("Cold start took %.2fs (budget %.2fs)", cold_start, COLD_START_BUDGET)
+    if getattr(_open, "profiling", False):
+        write_dumps()
+
+
+def _fragment_rerun():
+    ctx = get_script_run_ctx()
+    return bool(ctx and ctx.fragment_ids_this_run)
+
+
+@contextmanager
+def timed(name):
+    """Time a block that can rerun on its own (an st.fragment body)."""
+    fragment_rerun = _fragment_rerun()
+    if fragment_rerun:
+        # app.py's top (and start_page) did not run: take the session's setting
+        _set_profiling(st.session_state.get(PROFILING_KEY, False))
+    start = _snapshot()
+    try:
+        yield
+    finally:
+        _record(name, start, "fragment")
+        if fragment_rerun and getattr(_open, "profiling", False):
+            write_dumps()
+
+
+# =========================
+# Readouts
+# =========================
+def timings():
+    return dict(st.session_state.get(STATE_KEY, {}))
+
+
+def page_runs():
+    return st.session_state.get(PAGE_RUNS_KEY, 0)
+
+
+def caption(name):
+    """One-line readout for ``name``; shown inside fragments so it refreshes with them."""
+    entry = st.session_state.get(STATE_KEY, {}).get(name)
+    if entry:
+        extra = f" · {entry['sent_bytes'] / 1024:.1f} KB sent" if "sent_bytes" in entry else ""
+        st.caption(f"⏱️ {name}: {entry['last_ms']:.1f} ms{extra} · ran {entry['runs']}× · full page runs: {page_runs()}")
+
+
+def table():
+    """Markdown table of every section's last duration and run count (and profile, if any)."""
+    entries = timings()
+    profiled = any("sent_bytes" in e for e in entries.values())
+    head = "| section | scope | last ms | runs |"
+    rule = "|---|---|---:|---:|"
+    if profiled:
+        head += " KB sent | files | KB read | KB written |"
+        rule += "---:|---:|---:|---:|"
+    lines = [head, rule]
+    for name, e in entries.items():
+        row = f"| {name} | {e['scope']} | {e['last_ms']:.1f} | {e['runs']} |"
+        if profiled:
+            row += (f" {e.get('sent_bytes', 0) / 1024:.1f} | {e.get('files', 0)} |"
+                    f" {e.get('read_bytes', 0) / 1024:.1f} | {e.get('written_bytes', 0) / 1024:.1f} |")
+        lines.append(row)
+    return "\n".join(lines)
+
+
+def overlay():
+    """Fixed dev-mode panel with this session's last profiled run; the costliest section highlighted."""
+    entries = {n: e for n, e in timings().items() if "sent_bytes" in e}
+    if not entries:
+        return
+    page = [e for e in entries.values() if e["scope"] == "page"]
+    slowest = max(entries, key=lambda n: entries[n]["last_ms"])
+    heaviest = max(entries, key=lambda n: entries[n]["sent_bytes"])
+    rows = []
+    for name, e in entries.items():
+        rows.append(
+            f"<tr><td>{html.escape(name)}{'' if e['scope'] == 'page' else ' ⟳'}</td>"
+            f"<td class='{'perf-hot' if name == slowest else ''}'>{e['last_ms']:.1f}</td>"
+            f"<td class='{'perf-hot' if name == heaviest else ''}'>{e['sent_bytes'] / 1024:.1f}</td>"
+            f"<td>{e['files']}</td><td>{e['read_bytes'] / 1024:.1f}</td></tr>"
+        )
+    rows.append(
+        f"<tr class='perf-total'><td>page</td><td>{sum(e['last_ms'] for e in page):.1f}</td>"
+        f"<td>{sum(e['sent_bytes'] for e in page) / 1024:.1f}</td><td>{sum(e['files'] for e in page)}</td>"
+        f"<td>{sum(e['read_bytes'] for e in page) / 1024:.1f}</td></tr>"
+    )
+    st.markdown(
+        "<div class='perf-overlay'><table>"
+        "<tr><th>section</th><th>ms</th><th>KB sent</th><th>files</th><th>KB read</th></tr>"
+        + "".join(rows)
+        + f"</table><div class='perf-note'>run {page_runs()} · ⟳ fragment · dumps in {html.escape(PROFILE_DIR)}</div></div>",
+        unsafe_allow_html=True,
+    )
+
+
+# =========================
+# Dumps
+# =========================
+def snapshot():
+    """Process-wide sums over every profiled run, as a JSON-ready dict."""
+    with _totals_lock:
+        sections = {name: dict(total) for name, total in _totals.items()}
+    return {"generated_at": time.time(), "pid": os.getpid(), "cold_start_seconds": cold_start, "sections": sections}
+
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text(data=None):
+    """``snapshot()`` in the Prometheus text exposition format."""
+    data = data or snapshot()
+    families = [
+        ("runs_total", "counter", "Profiled runs of each app.py section.", "runs"),
+        ("seconds_total", "counter", "Wall time spent in each section.", "seconds"),
+        ("last_seconds", "gauge", "Wall time of the section's most recent profiled run.", "last_seconds"),
+        ("sent_bytes_total", "counter", "Serialized element bytes each section sent to the browser.", "sent_bytes"),
+        ("files_opened_total", "counter", "Files each section opened.", "files"),
+        ("read_bytes_total", "counter", "Bytes each section read (page cache included).", "read_bytes"),
+        ("written_bytes_total", "counter", "Bytes each section wrote.", "written_bytes"),
+    ]
+    lines = []
+    for suffix, kind, help_text, key in families:
+        name = f"{METRIC_PREFIX}_{suffix}"
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for section, total in data["sections"].items():
+            lines.append(f'{name}{{section="{_label(section)}",scope="{total["scope"]}"}} {total.get(key, 0)}')
+    if data["cold_start_seconds"] is not None:
+        lines.append("# HELP portfolio_cold_start_seconds Import plus first full page run of this process.")
+        lines.append("# TYPE portfolio_cold_start_seconds gauge")
+        lines.append(f"portfolio_cold_start_seconds {data['cold_start_seconds']:.6f}")
+    return "\n".join(lines) + "\n"
+
+
+def _write(path, text):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def write_dumps(directory=None):
+    """Write sections.json and sections.prom; failures are logged, never raised into the page."""
+    directory = directory or PROFILE_DIR
+    data = snapshot()
+    # Our own writes happen after the sections closed, so they are not attributed to any of them
+    was_profiling = getattr(_open, "profiling", False)
+    _open.profiling = False
+    try:
+        os.makedirs(directory, exist_ok=True)
+        _write(os.path.join(directory, "sections.json"), json.dumps(data, indent=1))
+        _write(os.path.join(directory, "sections.prom"), prometheus_text(data))
+    except OSError as e:
+        logger.warning("Could not write section profile to %s: %s", directory, e)
+    finally:
+        _open.profiling = was_profiling
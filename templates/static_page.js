@@ -0,0 +1,103 @@
+// Client-side behaviour of the static export (export_static.py): the typing
+// effect, project filtering, timeline tabs and the mailto contact form. The
+// live app does all of this in Python; here it costs the server nothing.
+(function () {
+  "use strict";
+
+  // Typing effect (same timing as the app's components.html block)
+  var typing = document.getElementById("typing");
+  if (typing) {
+    var roles = JSON.parse(typing.dataset.roles || "[]");
+    var i = 0, j = 0, deleting = false, delay = 80, pause = 800;
+    var loop = function () {
+      var word = roles[i % roles.length];
+      if (!deleting) {
+        typing.innerHTML = word.substring(0, j + 1) + '<span class="cursor">▮</span>';
+        j++;
+        if (j === word.length) { deleting = true; setTimeout(loop, pause); return; }
+      } else {
+        typing.innerHTML = word.substring(0, j - 1) + '<span class="cursor">▮</span>';
+        j--;
+        if (j === 0) { deleting = false; i++; }
+      }
+      setTimeout(loop, deleting ? delay / 2 : delay);
+    };
+    if (roles.length) setTimeout(loop, 500);
+  }
+
+  // Project filters: the same rules as project_index.ProjectIndex.filter —
+  // any/all over the selected tags, and every query word must be a prefix of
+  // some title/description token (tokens are precomputed by the export)
+  var indexEl = document.getElementById("project-index");
+  if (indexEl) {
+    var index = JSON.parse(indexEl.textContent);
+    var cards = document.querySelectorAll("[data-project]");
+    var search = document.getElementById("project-search");
+    var empty = document.getElementById("project-empty");
+    var active = new Set();
+    var mode = "any";
+
+    var terms = function (text) { return text.toLowerCase().match(/[a-z0-9]+/g) || []; };
+    var matches = function (p, words) {
+      if (active.size) {
+        var hits = p.tags.filter(function (t) { return active.has(t); }).length;
+        if (mode === "all" ? hits < active.size : hits === 0) return false;
+      }
+      return words.every(function (w) {
+        return p.tokens.some(function (t) { return t.lastIndexOf(w, 0) === 0; });
+      });
+    };
+    var apply = function () {
+      var words = terms(search.value), shown = 0;
+      cards.forEach(function (card) {
+        var ok = matches(index[+card.dataset.project], words);
+        card.hidden = !ok;
+        if (ok) shown++;
+      });
+      empty.hidden = shown > 0;
+    };
+
+    document.querySelectorAll("#tag-filter [data-tag]").forEach(function (button) {
+      button.addEventListener("click", function () {
+        var on = button.getAttribute("aria-pressed") !== "true";
+        button.setAttribute("aria-pressed", String(on));
+        if (on) active.add(button.dataset.tag); else active.delete(button.dataset.tag);
+        apply();
+      });
+    });
+    document.querySelectorAll("#tag-mode [data-mode]").forEach(function (button) {
+      button.addEventListener("click", function () {
+        mode = button.dataset.mode;
+        document.querySelectorAll("#tag-mode [data-mode]").forEach(function (b) {
+          b.setAttribute("aria-pressed", String(b === button));
+        });
+        apply();
+      });
+    });
+    search.addEventListener("input", apply);
+  }
+
+  // Timeline tabs
+  document.querySelectorAll(".tabs [data-tab]").forEach(function (tab) {
+    tab.addEventListener("click", function () {
+      document.querySelectorAll(".tabs [data-tab]").forEach(function (t) {
+        t.setAttribute("aria-selected", String(t === tab));
+      });
+      document.querySelectorAll("[data-panel]").forEach(function (panel) {
+        panel.hidden = panel.dataset.panel !== tab.dataset.tab;
+      });
+    });
+  });
+
+  // Contact form: opens the visitor's mail client, as the app's form does
+  var form = document.getElementById("contact-form");
+  if (form) {
+    form.addEventListener("submit", function (event) {
+      event.preventDefault();
+      var data = new FormData(form);
+      window.location.href = "mailto:" + form.dataset.to +
+        "?subject=" + encodeURIComponent("Portfolio Contact from " + data.get("name")) +
+        "&body=" + encodeURIComponent(data.get("message") + "\n\nFrom: " + data.get("email"));
+    });
+  }
+})();
@@ -0,0 +1,86 @@
+# theme.py
+# -------------------------------------------------------
+# All page styles in one stylesheet. The sources under
+# styles/ (plus the skill icon bundle, when built) are
+# concatenated and minified into .cache/site.css, which is
+# served like any other asset: a content-hashed URL the
+# browser fetches once and caches. A rerun only re-sends a
+# ~100-byte <link> instead of every <style> block.
+# -------------------------------------------------------
+
+import os
+import re
+import threading
+import time
+
+from assets import ASSET_MODE, DEFAULT_REVALIDATE_SECONDS, asset_url, icon_bundle
+
+STYLES_DIR = "styles"
+# Concatenated in this order
+STYLESHEETS = ("base.css", "components.css", "resume.css")
+COMPILED_PATH = os.path.join(".cache", "site.css")
+
+_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+_SPACE = re.compile(r"\s+")
+_PUNCT = re.compile(r"\s*([{};:,>])\s*")
+
+
+def minify(css):
+    css = _COMMENT.sub("", css)
+    css = _SPACE.sub(" ", css)
+    return _PUNCT.sub(r"\1", css).replace(";}", "}").strip()
+
+
+class SiteStylesheet:
+    """Compiles the stylesheet sources, again only when one of them changes."""
+
+    def __init__(self, names=STYLESHEETS, out_path=COMPILED_PATH, revalidate_seconds=DEFAULT_REVALIDATE_SECONDS):
+        self.names = tuple(names)
+        self.out_path = out_path
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.Lock()
+        self._checked = 0.0
+        self._signature = None
+        self.css = ""
+        self.compiles = 0
+
+    def sources(self):
+        paths = [os.path.join(STYLES_DIR, name) for name in self.names]
+        if icon_bundle.stylesheet:
+            paths.append(icon_bundle.stylesheet)
+        return paths
+
+    def compile(self):
+        """The minified stylesheet, rebuilt if a source changed since the last check."""
+        with self._lock:
+            now = time.monotonic()
+            if self._signature is not None and now - self._checked < self.revalidate_seconds:
+                return self.css
+            self._checked = now
+            paths = [p for p in self.sources() if os.path.isfile(p)]
+            signature = [(p, os.stat(p).st_mtime_ns, os.stat(p).st_size) for p in paths]
+            if signature == self._signature and os.path.isfile(self.out_path):
+                return self.css
+            parts = []
+            for path in paths:
+                with open(path, encoding="utf-8") as f:
+                    parts.append(minify(f.read()))
+            self.css = "\n".join(parts) + "\n"
+            os.makedirs(os.path.dirname(self.out_path), exist_ok=True)
+            tmp = f"{self.out_path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(self.css)
+            os.replace(tmp, self.out_path)
+            self._signature = signature
+            self.compiles += 1
+            return self.css
+
+    def html(self, mode=None):
+        """``<link>`` to the content-hashed stylesheet; the whole ``<style>`` in inline mode."""
+        css = self.compile()
+        if (mode or ASSET_MODE) == "inline":
+            return f"<style>{css}</style>"
+        return f'<link rel="stylesheet" href="{asset_url(self.out_path, mode)}">'
+
+
+site_stylesheet = SiteStylesheet()